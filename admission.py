@@ -0,0 +1,254 @@
+"""
+Admission control berdasarkan estimasi memori per request
+
+Setiap request yang berat (enkripsi/dekripsi teks, file, stream, analisis,
+bulk dan pembangkitan kunci) diberi estimasi puncak memori dari Content-Length
+(atau jumlah huruf kunci) dan tipe cipher.
+Request baru dijalankan jika estimasinya masih muat di budget memori global;
+jika tidak, request menunggu di antrian dan ditolak (503 + Retry-After)
+setelah batas waktu tunggu.
+
+Puncak alokasi sebenarnya diukur dengan tracemalloc pada sebagian request
+(sampling) agar estimasi bisa divalidasi lewat /stats. tracemalloc mencatat
+alokasi semua thread, jadi saat ada request lain yang berjalan bersamaan
+hasilnya adalah batas atas.
+"""
+
+import math
+import random
+import threading
+import time
+import tracemalloc
+
+# Overhead tetap per request (objek Flask/Werkzeug, tabel cipher, dll.)
+BASE_OVERHEAD = 1024 * 1024
+
+# Puncak memori per byte input untuk teks (body + string + hasil + JSON),
+# diukur dengan tracemalloc. Engine numpy memakai array int64 per huruf.
+TEXT_FACTORS = {
+    'shift': 5,
+    'substitution': 5,
+    'affine': 5,
+    'vigenere': 34,
+    'hill': 38,
+    'permutation': 30,
+}
+
+# Puncak memori per byte untuk file format raw (file.read() + hasil).
+# Format kontainer diproses per chunk sehingga selalu di bawah estimasi ini.
+BYTE_FACTORS = {
+    'hill': 6,
+}
+DEFAULT_BYTE_FACTOR = 3
+
+# Endpoint streaming hanya menahan beberapa chunk sekaligus
+STREAM_WINDOW = 4 * 64 * 1024
+
+# Analisis frekuensi memproses chunk 1MB; array kode/bigram/trigram dan
+# konversi intp di np.bincount memakai sekitar 20 byte per byte input
+ANALYSIS_WINDOW = 20 * 1024 * 1024
+
+# Bulk berjalan di process worker dengan jumlah task in-flight terbatas
+BULK_RESERVE = 64 * 1024 * 1024
+
+# Puncak memori /keygen per huruf kunci (array acak int64/uint64, string dan
+# JSON). Hill membangkitkan beberapa kali lipat kandidat matriks lalu menyaring.
+KEYGEN_FACTORS = {
+    'hill': 300,
+}
+DEFAULT_KEYGEN_FACTOR = 96
+
+
+def estimate_peak_bytes(kind: str, cipher_type: str, content_length: int) -> int:
+    """
+    Estimasi puncak memori sebuah request
+
+    Args:
+        kind (str): 'text', 'file', 'stream', 'analysis', 'bulk' atau 'keygen'
+        cipher_type (str): Tipe cipher, None jika belum diketahui (dipakai nilai terburuk)
+        content_length (int): Ukuran body request dalam byte (untuk 'keygen':
+            jumlah huruf kunci yang diminta, lihat keygen.key_letters)
+
+    Returns:
+        int: Estimasi puncak memori dalam byte
+    """
+    text_factor = TEXT_FACTORS.get(cipher_type, max(TEXT_FACTORS.values()))
+
+    if kind == 'text':
+        return BASE_OVERHEAD + content_length * text_factor
+    if kind == 'file':
+        if cipher_type in TEXT_FACTORS:
+            byte_factor = BYTE_FACTORS.get(cipher_type, DEFAULT_BYTE_FACTOR)
+        else:
+            byte_factor = max(DEFAULT_BYTE_FACTOR, *BYTE_FACTORS.values())
+        return BASE_OVERHEAD + content_length * byte_factor
+    if kind == 'stream':
+        return BASE_OVERHEAD + STREAM_WINDOW * text_factor
+    if kind == 'analysis':
+        return BASE_OVERHEAD + ANALYSIS_WINDOW
+    if kind == 'bulk':
+        return BASE_OVERHEAD + BULK_RESERVE
+    if kind == 'keygen':
+        return BASE_OVERHEAD + content_length * KEYGEN_FACTORS.get(cipher_type, DEFAULT_KEYGEN_FACTOR)
+    raise ValueError(f"Jenis request tidak valid: {kind}")
+
+
+class AdmissionRejected(Exception):
+    """Budget memori habis dan batas waktu tunggu terlewati"""
+
+    def __init__(self, retry_after: int):
+        super().__init__('Server sedang sibuk, coba lagi nanti')
+        self.retry_after = retry_after
+
+
+class MemoryBudget:
+    """Budget memori global; request menunggu sampai estimasinya muat"""
+
+    def __init__(self, limit_bytes: int = 512 * 1024 * 1024, max_wait: float = 10.0,
+                 max_queue: int = 64):
+        self.limit_bytes = limit_bytes
+        self.max_wait = max_wait
+        self.max_queue = max_queue
+
+        self._cond = threading.Condition()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.queued = 0
+        self.rejected = 0
+        self._avg_hold = 1.0
+
+    def acquire(self, nbytes: int) -> int:
+        """
+        Reservasi memori untuk satu request
+
+        Estimasi yang melebihi seluruh budget dibatasi ke budget, sehingga
+        request tersebut tetap bisa berjalan sendirian.
+
+        Returns:
+            int: Jumlah byte yang direservasi (dipakai saat release)
+        """
+        granted = min(nbytes, self.limit_bytes)
+        deadline = time.monotonic() + self.max_wait
+
+        with self._cond:
+            if self.in_use + granted > self.limit_bytes:
+                if self.waiting >= self.max_queue:
+                    self.rejected += 1
+                    raise AdmissionRejected(self.retry_after())
+
+                self.waiting += 1
+                self.queued += 1
+                try:
+                    while self.in_use + granted > self.limit_bytes:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            self.rejected += 1
+                            raise AdmissionRejected(self.retry_after())
+                        self._cond.wait(remaining)
+                finally:
+                    self.waiting -= 1
+
+            self.in_use += granted
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.admitted += 1
+        return granted
+
+    def release(self, granted: int, held_seconds: float = None):
+        """Kembalikan reservasi dan bangunkan request yang menunggu"""
+        with self._cond:
+            self.in_use -= granted
+            if held_seconds is not None:
+                # Rata-rata bergerak lama request, dipakai untuk Retry-After
+                self._avg_hold = 0.9 * self._avg_hold + 0.1 * held_seconds
+            self._cond.notify_all()
+
+    def retry_after(self) -> int:
+        """Perkiraan detik sampai memori tersedia lagi"""
+        return max(1, math.ceil(self._avg_hold))
+
+    def stats(self) -> dict:
+        with self._cond:
+            return {
+                'limit_bytes': self.limit_bytes,
+                'in_use_bytes': self.in_use,
+                'peak_in_use_bytes': self.peak_in_use,
+                'waiting': self.waiting,
+                'admitted': self.admitted,
+                'queued': self.queued,
+                'rejected': self.rejected,
+            }
+
+
+class MemoryProfiler:
+    """Pengukuran puncak alokasi per request dengan tracemalloc (sampling)"""
+
+    def __init__(self, sample_rate: float = 0.05):
+        self.sample_rate = sample_rate
+        self._active = threading.Lock()
+        self._lock = threading.Lock()
+        self._records = {}
+
+    def start(self) -> bool:
+        """Mulai mengukur jika request ini terpilih sampel; hanya satu sampel sekaligus"""
+        if self.sample_rate <= 0 or random.random() >= self.sample_rate:
+            return False
+        if not self._active.acquire(blocking=False):
+            return False
+
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._owns_tracing = False
+        else:
+            tracemalloc.start()
+            self._owns_tracing = True
+        return True
+
+    def stop(self, started: bool):
+        """Selesai mengukur, mengembalikan puncak alokasi dalam byte"""
+        if not started:
+            return None
+        _, peak = tracemalloc.get_traced_memory()
+        if self._owns_tracing:
+            tracemalloc.stop()
+        self._active.release()
+        return peak
+
+    def record(self, label: str, estimate: int, peak: int):
+        """Simpan perbandingan estimasi dan puncak sebenarnya"""
+        with self._lock:
+            entry = self._records.setdefault(label, {
+                'samples': 0,
+                'estimate_bytes': 0,
+                'peak_bytes': 0,
+                'max_peak_bytes': 0,
+                'max_ratio': 0.0,
+                'underestimated': 0,
+            })
+            entry['samples'] += 1
+            entry['estimate_bytes'] += estimate
+            entry['peak_bytes'] += peak
+            entry['max_peak_bytes'] = max(entry['max_peak_bytes'], peak)
+            entry['max_ratio'] = max(entry['max_ratio'], peak / estimate if estimate else 0.0)
+            if peak > estimate:
+                entry['underestimated'] += 1
+
+    def stats(self) -> dict:
+        """Rata-rata estimasi vs puncak per jenis request dan cipher"""
+        with self._lock:
+            result = {}
+            for label, entry in self._records.items():
+                samples = entry['samples']
+                result[label] = {
+                    'samples': samples,
+                    'mean_estimate_bytes': entry['estimate_bytes'] // samples,
+                    'mean_peak_bytes': entry['peak_bytes'] // samples,
+                    'max_peak_bytes': entry['max_peak_bytes'],
+                    'max_ratio': round(entry['max_ratio'], 3),
+                    'underestimated': entry['underestimated'],
+                }
+            return {
+                'sample_rate': self.sample_rate,
+                'requests': result,
+            }
@@ -0,0 +1,146 @@
+"""
+Analisis frekuensi streaming untuk ciphertext berukuran besar
+
+Input diproses per chunk: huruf A-Z (besar/kecil) diubah menjadi kode 0-25,
+lalu unigram, bigram dan trigram dihitung dengan np.bincount atas kode
+basis 26 (bigram = a*26 + b, trigram = a*676 + b*26 + c). Dua huruf terakhir
+tiap chunk dibawa ke chunk berikutnya agar n-gram yang melintasi batas chunk
+tetap terhitung. Karakter selain huruf diabaikan, sehingga n-gram dihitung
+atas deretan huruf saja seperti pada kriptanalisis klasik.
+
+Memori yang dipakai hanya tabel hitungan (26 + 26^2 + 26^3 angka) ditambah
+satu chunk, berapapun ukuran inputnya.
+"""
+
+import numpy as np
+
+ALPHABET = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# Frekuensi relatif huruf dalam teks bahasa Inggris
+ENGLISH_FREQUENCIES = np.array([
+    0.08167, 0.01492, 0.02782, 0.04253, 0.12702, 0.02228, 0.02015,
+    0.06094, 0.06966, 0.00153, 0.00772, 0.04025, 0.02406, 0.06749,
+    0.07507, 0.01929, 0.00095, 0.05987, 0.06327, 0.09056, 0.02758,
+    0.00978, 0.02360, 0.00150, 0.01974, 0.00074,
+])
+ENGLISH_IOC = float(np.sum(ENGLISH_FREQUENCIES ** 2))
+RANDOM_IOC = 1 / 26
+
+
+def letter_codes(data: bytes) -> np.ndarray:
+    """Kode 0-25 untuk setiap huruf ASCII dalam data, karakter lain dibuang"""
+    upper = np.frombuffer(data, dtype=np.uint8) & 0xDF
+    return upper[(upper >= 65) & (upper <= 90)] - 65
+
+
+class FrequencyAnalyzer:
+    """Akumulator unigram/bigram/trigram yang diperbarui per chunk"""
+
+    def __init__(self):
+        self.unigrams = np.zeros(26, dtype=np.int64)
+        self.bigrams = np.zeros(26 ** 2, dtype=np.int64)
+        self.trigrams = np.zeros(26 ** 3, dtype=np.int64)
+        self.total_bytes = 0
+        self._tail = np.zeros(0, dtype=np.uint16)
+
+    @property
+    def letters(self) -> int:
+        return int(self.unigrams.sum())
+
+    def update(self, data):
+        """Tambahkan satu chunk (bytes atau str) ke hitungan"""
+        if isinstance(data, str):
+            data = data.encode('utf-8', 'surrogatepass')
+        self.total_bytes += len(data)
+        self.update_codes(letter_codes(data))
+
+    def update_codes(self, codes: np.ndarray):
+        """Tambahkan deretan kode huruf 0-25 ke hitungan"""
+        if len(codes) == 0:
+            return
+
+        # Indeks trigram maksimal 26^3 - 1, masih muat di uint16
+        codes = codes.astype(np.uint16)
+        tail = len(self._tail)
+        sequence = np.concatenate([self._tail, codes]) if tail else codes
+        self.unigrams += np.bincount(codes, minlength=26)
+
+        # Hanya n-gram yang berakhir di chunk ini; yang seluruhnya berada di
+        # tail sudah dihitung pada chunk sebelumnya
+        if len(sequence) >= 2:
+            pairs = sequence[:-1] * 26 + sequence[1:]
+            self.bigrams += np.bincount(pairs[max(tail - 1, 0):], minlength=26 ** 2)
+            if len(sequence) >= 3:
+                triples = pairs[:-1] * 26 + sequence[2:]
+                self.trigrams += np.bincount(triples[max(tail - 2, 0):], minlength=26 ** 3)
+
+        self._tail = sequence[-2:].copy()
+
+    def index_of_coincidence(self) -> float:
+        """Peluang dua huruf acak dari teks sama"""
+        total = self.letters
+        if total < 2:
+            return 0.0
+        counts = self.unigrams.astype(np.float64)
+        return float(np.sum(counts * (counts - 1)) / (total * (total - 1)))
+
+    def chi_squared(self, counts: np.ndarray = None) -> float:
+        """Chi-squared distribusi huruf terhadap bahasa Inggris"""
+        if counts is None:
+            counts = self.unigrams
+        total = counts.sum()
+        if total == 0:
+            return 0.0
+        expected = ENGLISH_FREQUENCIES * total
+        return float(np.sum((counts - expected) ** 2 / expected))
+
+    def likely_shift(self) -> int:
+        """Pergeseran Caesar dengan chi-squared terkecil terhadap bahasa Inggris"""
+        scores = [self.chi_squared(np.roll(self.unigrams, -shift)) for shift in range(26)]
+        return int(np.argmin(scores))
+
+    def _top(self, counts: np.ndarray, size: int, limit: int) -> list:
+        """n-gram terbanyak sebagai daftar [teks, jumlah]"""
+        nonzero = np.flatnonzero(counts)
+        if len(nonzero) > limit:
+            nonzero = nonzero[np.argpartition(counts[nonzero], -limit)[-limit:]]
+        nonzero = nonzero[np.argsort(-counts[nonzero], kind='stable')]
+
+        result = []
+        for index, count in zip(nonzero.tolist(), counts[nonzero].tolist()):
+            letters = []
+            for _ in range(size):
+                index, code = divmod(index, 26)
+                letters.append(ALPHABET[code])
+            result.append([''.join(reversed(letters)), count])
+        return result
+
+    def result(self, top: int = 20) -> dict:
+        """Ringkasan histogram dan statistik untuk frontend"""
+        return {
+            'total_bytes': self.total_bytes,
+            'letters': self.letters,
+            'unigrams': dict(zip(ALPHABET, self.unigrams.tolist())),
+            'bigrams': self._top(self.bigrams, 2, top),
+            'trigrams': self._top(self.trigrams, 3, top),
+            'index_of_coincidence': self.index_of_coincidence(),
+            'english_ioc': ENGLISH_IOC,
+            'random_ioc': RANDOM_IOC,
+            'chi_squared': self.chi_squared(),
+            'likely_shift': self.likely_shift(),
+        }
+
+
+def analyze_stream(chunks, top: int = 20) -> dict:
+    """Analisis frekuensi dari iterable chunk (bytes atau str)"""
+    analyzer = FrequencyAnalyzer()
+    for chunk in chunks:
+        analyzer.update(chunk)
+    return analyzer.result(top)
+
+
+def analyze_file(path: str, top: int = 20, chunk_size: int = DEFAULT_CHUNK_SIZE) -> dict:
+    """Analisis frekuensi file dengan memori konstan"""
+    with open(path, 'rb') as f:
+        return analyze_stream(iter(lambda: f.read(chunk_size), b''), top)
@@ -1,14 +1,140 @@
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, render_template, request, jsonify, send_file, Response, stream_with_context, g
+from werkzeug.wsgi import get_input_stream
+from urllib.parse import unquote
+import codecs
 import os
 import tempfile
+import time
 import base64
-from ciphers import (
-    ShiftCipher, SubstitutionCipher, AffineCipher, 
-    VigenereCipher, HillCipher, PermutationCipher
-)
+import secrets
+from ciphers import ENGINE_CONFIG_PATH, save_engine_thresholds
+from registry import create_cipher
+from container import ContainerWriter, ContainerReader, ContainerError, MAGIC
+from bulk import bulk_encrypt
+from cache import ResultCache, make_cache_key
+from incremental import SessionStore
+from uploads import UploadStore, UploadError, DEFAULT_CHUNK_SIZE as UPLOAD_CHUNK_SIZE
+from analysis import FrequencyAnalyzer, DEFAULT_CHUNK_SIZE as ANALYSIS_CHUNK_SIZE
+from admission import MemoryBudget, MemoryProfiler, AdmissionRejected, estimate_peak_bytes
+from keygen import KeyPool, key_letters
 
 app = Flask(__name__)
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['MAX_STREAM_CONTENT_LENGTH'] = 512 * 1024 * 1024  # 512MB untuk endpoint raw
+app.config['STREAM_CHUNK_SIZE'] = 64 * 1024
+# Body teks raw sampai ukuran ini dibaca utuh agar bisa dilayani result cache
+# (sama dengan jendela stream di admission.py, jadi estimasi memori tetap berlaku)
+app.config['RAW_CACHE_MAX_LENGTH'] = 256 * 1024
+app.config['MAX_ANALYZE_CONTENT_LENGTH'] = 4 * 1024 * 1024 * 1024  # 4GB untuk analisis frekuensi
+app.config['MAX_KEYGEN_COUNT'] = 1000
+# Batas total huruf kunci per request /keygen (jumlah x ukuran) dan panjang
+# kunci Vigenere lewat web; kunci OTP panjang dibuat dengan generate_otp_key.py
+app.config['MAX_KEYGEN_LETTERS'] = 1000000
+app.config['MAX_KEYGEN_VIGENERE_SIZE'] = 10000
+# Batas isi arsip untuk /bulk/encrypt (mencegah zip bomb memenuhi disk)
+app.config['MAX_BULK_EXTRACT_BYTES'] = int(os.environ.get('KRIPTO_BULK_MAX_BYTES', 1024 * 1024 * 1024))
+app.config['MAX_BULK_FILES'] = int(os.environ.get('KRIPTO_BULK_MAX_FILES', 10000))
+
+# Sesi enkripsi inkremental untuk mode live-typing
+incremental_sessions = SessionStore()
+
+# Cache hasil teks; set KRIPTO_CACHE_DIR untuk mengaktifkan tier disk
+result_cache = ResultCache(
+    max_bytes=int(os.environ.get('KRIPTO_CACHE_MAX_BYTES', 64 * 1024 * 1024)),
+    disk_dir=os.environ.get('KRIPTO_CACHE_DIR') or None
+)
+
+# Upload per chunk yang bisa dilanjutkan; state disimpan di direktori ini
+chunked_uploads = UploadStore(
+    os.environ.get('KRIPTO_UPLOAD_DIR') or os.path.join(tempfile.gettempdir(), 'kripto_uploads')
+)
+
+# Stok kunci acak untuk /keygen, diisi ulang di thread latar belakang
+key_pool = KeyPool()
+
+# Budget memori global untuk admission control (lihat admission.py)
+memory_budget = MemoryBudget(
+    limit_bytes=int(os.environ.get('KRIPTO_MEMORY_BUDGET', 512 * 1024 * 1024)),
+    max_wait=float(os.environ.get('KRIPTO_ADMISSION_WAIT', 10))
+)
+memory_profiler = MemoryProfiler(
+    sample_rate=float(os.environ.get('KRIPTO_MEMORY_SAMPLE_RATE', 0.05))
+)
+
+# Endpoint yang melewati admission control dan jenis request-nya
+# (None: ditentukan dari mimetype, file upload atau JSON)
+ADMISSION_ENDPOINTS = {
+    'encrypt': None,
+    'decrypt': None,
+    'encrypt_raw': 'stream',
+    'decrypt_raw': 'stream',
+    'encrypt_bulk': 'bulk',
+    'incremental_start': 'text',
+    'analyze': 'analysis',
+    'upload_chunk': 'file',
+    'keygen': 'keygen',
+}
+
+@app.before_request
+def admit_request():
+    """Reservasi memori berdasarkan estimasi sebelum body diproses"""
+    if request.endpoint not in ADMISSION_ENDPOINTS:
+        return None
+    
+    kind = ADMISSION_ENDPOINTS[request.endpoint]
+    if kind is None:
+        kind = 'file' if request.mimetype == 'multipart/form-data' else 'text'
+    
+    # Tipe cipher dari header/query agar body tidak perlu di-parse dulu
+    cipher_type = request.headers.get('X-Cipher-Type') or request.args.get('cipher_type')
+    content_length = request.content_length
+    if kind == 'keygen':
+        content_length = requested_key_letters()
+    elif content_length is None:
+        content_length = app.config['MAX_CONTENT_LENGTH']
+    estimate = estimate_peak_bytes(kind, cipher_type, content_length)
+    
+    try:
+        granted = memory_budget.acquire(estimate)
+    except AdmissionRejected as e:
+        response = jsonify({
+            'success': False,
+            'error': str(e)
+        })
+        response.status_code = 503
+        response.headers['Retry-After'] = str(e.retry_after)
+        return response
+    
+    g.admission = {
+        'label': f"{kind}:{cipher_type or '*'}",
+        'estimate': estimate,
+        'granted': granted,
+        'started': time.monotonic(),
+        'sampled': memory_profiler.start(),
+    }
+    return None
+
+@app.after_request
+def defer_release(response):
+    """Lepas reservasi memori saat response selesai dikirim (termasuk streaming)"""
+    admission = g.pop('admission', None)
+    if admission is not None:
+        response.call_on_close(lambda: finish_admission(admission))
+    return response
+
+@app.teardown_request
+def release_request(exc):
+    """Lepas reservasi memori jika request berhenti sebelum after_request"""
+    admission = g.pop('admission', None)
+    if admission is not None:
+        finish_admission(admission)
+
+def finish_admission(admission):
+    """Catat puncak memori (jika disampel) dan kembalikan reservasi ke budget"""
+    peak = memory_profiler.stop(admission['sampled'])
+    if peak is not None:
+        memory_profiler.record(admission['label'], admission['estimate'], peak)
+    memory_budget.release(admission['granted'], time.monotonic() - admission['started'])
 
 @app.route('/')
 def index():
@@ -33,16 +159,17 @@ def encrypt():
             # Pilih cipher berdasarkan tipe
             cipher = get_cipher_instance(cipher_type, key)
             
-            # Baca file
-            file_data = file.read()
             file_name = file.filename
-            
-            # Enkripsi file
-            encrypted_data = cipher.encrypt_bytes(file_data)
-            
-            # Simpan file terenkripsi
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.dat')
-            temp_file.write(encrypted_data)
+            
+            if request.form.get('format') == 'raw':
+                # Format lama: byte terenkripsi tanpa header
+                temp_file.write(cipher.encrypt_bytes(file.read()))
+            else:
+                # Format kontainer: baca dan enkripsi per chunk
+                with ContainerWriter(temp_file, cipher_type, key, cipher) as writer:
+                    for block in iter(lambda: file.stream.read(writer.chunk_size), b''):
+                        writer.write(block)
             temp_file.close()
             
             return jsonify({
@@ -62,7 +189,7 @@ def encrypt():
             cipher = get_cipher_instance(cipher_type, key)
             
             # Enkripsi teks
-            encrypted_text = cipher.encrypt(text)
+            encrypted_text = cached_transform(cipher, 'encrypt', text)
             return jsonify({
                 'success': True,
                 'encrypted_text': encrypted_text
@@ -94,16 +221,25 @@ def decrypt():
             # Pilih cipher berdasarkan tipe
             cipher = get_cipher_instance(cipher_type, key)
             
-            # Baca file
-            file_data = file.read()
-            
-            # Dekripsi file
-            decrypted_data = cipher.decrypt_bytes(file_data)
+            # Simpan upload ke disk agar kontainer bisa di-mmap
+            upload = tempfile.NamedTemporaryFile(delete=False, suffix='.dat')
+            file.save(upload)
+            upload.close()
             
-            # Simpan file terdekripsi
             temp_file = tempfile.NamedTemporaryFile(delete=False, suffix=original_file_name)
-            temp_file.write(decrypted_data)
-            temp_file.close()
+            try:
+                with open(upload.name, 'rb') as f:
+                    is_container_file = f.read(len(MAGIC)) == MAGIC
+                
+                if is_container_file:
+                    decrypt_container(upload.name, temp_file, cipher_type, key, cipher)
+                else:
+                    # File lama tanpa header
+                    with open(upload.name, 'rb') as f:
+                        temp_file.write(cipher.decrypt_bytes(f.read()))
+            finally:
+                temp_file.close()
+                os.remove(upload.name)
             
             return jsonify({
                 'success': True,
@@ -122,7 +258,7 @@ def decrypt():
             cipher = get_cipher_instance(cipher_type, key)
             
             # Dekripsi teks
-            decrypted_text = cipher.decrypt(text)
+            decrypted_text = cached_transform(cipher, 'decrypt', text)
             return jsonify({
                 'success': True,
                 'decrypted_text': decrypted_text
@@ -134,27 +270,503 @@ def decrypt():
             'error': str(e)
         })
 
+@app.route('/bulk/encrypt', methods=['POST'])
+def encrypt_bulk():
+    try:
+        file = request.files.get('file')
+        cipher_type = request.form.get('cipher_type')
+        key = request.form.get('key', '')
+        
+        if not file or not cipher_type or not key:
+            return jsonify({
+                'success': False,
+                'error': 'Arsip, cipher type, dan key harus diisi'
+            })
+        
+        # Simpan arsip upload dengan ekstensi aslinya agar formatnya dikenali
+        suffix = '.zip' if file.filename.lower().endswith('.zip') else '.tar'
+        upload = tempfile.NamedTemporaryFile(delete=False, suffix=suffix)
+        file.save(upload)
+        upload.close()
+        
+        output = tempfile.NamedTemporaryFile(delete=False, suffix='.zip')
+        output.close()
+        try:
+            manifest = bulk_encrypt(
+                upload.name, output.name, cipher_type, key,
+                max_extract_bytes=app.config['MAX_BULK_EXTRACT_BYTES'],
+                max_extract_files=app.config['MAX_BULK_FILES']
+            )
+        finally:
+            os.remove(upload.name)
+        
+        return jsonify({
+            'success': True,
+            'message': f"{manifest['file_count']} file berhasil dienkripsi",
+            'file_path': output.name,
+            'file_name': os.path.splitext(file.filename)[0] + '.encrypted.zip',
+            'file_count': manifest['file_count'],
+            'total_bytes': manifest['total_bytes'],
+            'total_seconds': manifest['total_seconds']
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/encrypt/raw', methods=['POST'])
+def encrypt_raw():
+    return process_raw_body('encrypt')
+
+@app.route('/decrypt/raw', methods=['POST'])
+def decrypt_raw():
+    return process_raw_body('decrypt')
+
+def process_raw_body(direction):
+    """Proses body text/plain atau application/octet-stream secara streaming"""
+    try:
+        # Cipher dan kunci dari header (kunci di-URL-encode) atau query string
+        cipher_type = request.headers.get('X-Cipher-Type') or request.args.get('cipher_type')
+        key = unquote(request.headers.get('X-Cipher-Key', '')) or request.args.get('key', '')
+        
+        if not cipher_type or not key:
+            return jsonify({
+                'success': False,
+                'error': 'Cipher type dan key harus diisi'
+            }), 400
+        
+        cipher = get_cipher_instance(cipher_type, key)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    # Baca langsung dari WSGI input agar body tidak di-buffer seluruhnya
+    stream = get_input_stream(request.environ, max_content_length=app.config['MAX_STREAM_CONTENT_LENGTH'])
+    chunk_size = app.config['STREAM_CHUNK_SIZE']
+    raw_chunks = iter(lambda: stream.read(chunk_size), b'')
+    
+    if request.mimetype == 'application/octet-stream':
+        # Mode blok dengan padding (Hill): ciphertext harus kelipatan ukuran blok
+        block = getattr(cipher, 'byte_block_size', 1)
+        length = request.content_length
+        if direction == 'decrypt' and block > 1 and length is not None and (length == 0 or length % block):
+            return jsonify({
+                'success': False,
+                'error': f'Panjang ciphertext harus kelipatan {block} byte'
+            }), 400
+        
+        if direction == 'encrypt':
+            output = cipher.encrypt_bytes_stream(raw_chunks)
+        else:
+            output = cipher.decrypt_bytes_stream(raw_chunks)
+        return stream_response(output, bytes, 'utf-8', mimetype='application/octet-stream')
+    
+    charset = request.mimetype_params.get('charset', 'utf-8')
+    length = request.content_length
+    if cipher.deterministic and length is not None and length <= app.config['RAW_CACHE_MAX_LENGTH']:
+        # Teks dari UI biasanya kecil: proses utuh lewat result cache
+        try:
+            result = cached_transform(cipher, direction, b''.join(raw_chunks).decode(charset, 'replace'))
+            body = result.encode(charset)
+        except Exception as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        return Response(body, content_type=f'text/plain; charset={charset}')
+    
+    text_chunks = decode_chunks(raw_chunks, charset)
+    if direction == 'encrypt':
+        output = cipher.encrypt_stream(text_chunks)
+    else:
+        output = cipher.decrypt_stream(text_chunks)
+    return stream_response(output, lambda part: part.encode(charset), charset,
+                           content_type=f'text/plain; charset={charset}')
+
+def stream_response(output, encode, charset, **kwargs):
+    """
+    Response streaming dari generator output. Error pada potongan pertama
+    masih bisa dikembalikan sebagai 400; error setelah status 200 terkirim
+    ditandai dengan token acak dari header X-Stream-Error-Token diikuti
+    pesan error, lalu stream diakhiri.
+    """
+    try:
+        first = next(output, None)
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+    
+    token = secrets.token_hex(16)
+    
+    def generate():
+        try:
+            if first is not None:
+                yield encode(first)
+            for part in output:
+                yield encode(part)
+        except Exception as e:
+            app.logger.warning('Stream dihentikan: %s', e)
+            yield f'\n{token}{e}'.encode(charset)
+    
+    response = Response(stream_with_context(generate()), **kwargs)
+    response.headers['X-Stream-Error-Token'] = token
+    return response
+
+def decode_chunks(raw_chunks, charset):
+    """Decode potongan bytes menjadi teks tanpa memotong karakter multi-byte"""
+    decoder = codecs.getincrementaldecoder(charset)(errors='replace')
+    for raw in raw_chunks:
+        text = decoder.decode(raw)
+        if text:
+            yield text
+    tail = decoder.decode(b'', final=True)
+    if tail:
+        yield tail
+
+def decrypt_container(path, out_file, cipher_type, key, cipher):
+    """Dekripsi file kontainer ke out_file, opsional hanya rentang byte tertentu"""
+    with ContainerReader(path, cipher) as reader:
+        if not reader.matches_key(cipher_type, key):
+            raise ContainerError('Tipe cipher atau kunci tidak cocok dengan file')
+        
+        range_start = request.form.get('range_start', '')
+        range_end = request.form.get('range_end', '')
+        if range_start or range_end:
+            start = int(range_start) if range_start else 0
+            end = int(range_end) if range_end else reader.original_length
+            out_file.write(reader.read_range(start, end))
+        else:
+            for chunk in reader.iter_chunks():
+                out_file.write(chunk)
+
+def cached_transform(cipher, direction, text):
+    """Enkripsi/dekripsi teks lewat result cache"""
+    if not cipher.deterministic or result_cache.should_bypass(text):
+        return getattr(cipher, direction)(text)
+    
+    cache_key = make_cache_key(cipher.name, cipher.normalized_key(), direction, text)
+    result = result_cache.get(cache_key)
+    if result is None:
+        result = getattr(cipher, direction)(text)
+        result_cache.put(cache_key, result)
+    return result
+
+@app.route('/analyze', methods=['POST'])
+def analyze():
+    """Analisis frekuensi file upload atau body raw (text/plain, octet-stream)"""
+    try:
+        top = min(int(request.args.get('top', 20)), 100)
+        
+        if request.mimetype == 'multipart/form-data':
+            file = request.files.get('file')
+            if not file:
+                return jsonify({
+                    'success': False,
+                    'error': 'File harus diisi'
+                }), 400
+            source = file.stream
+        else:
+            # Body dibaca per chunk langsung dari WSGI input
+            source = get_input_stream(request.environ, max_content_length=app.config['MAX_ANALYZE_CONTENT_LENGTH'])
+        
+        analyzer = FrequencyAnalyzer()
+        for chunk in iter(lambda: source.read(ANALYSIS_CHUNK_SIZE), b''):
+            analyzer.update(chunk)
+        
+        return jsonify({
+            'success': True,
+            'analysis': analyzer.result(top)
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/incremental/start', methods=['POST'])
+def incremental_start():
+    try:
+        data = request.get_json()
+        cipher_type = data.get('cipher_type')
+        key = data.get('key', '')
+        direction = data.get('direction', 'encrypt')
+        text = data.get('text', '')
+        
+        cipher = get_cipher_instance(cipher_type, key)
+        session_id, session = incremental_sessions.create(cipher, direction, text)
+        return jsonify({
+            'success': True,
+            'session_id': session_id,
+            'result': session.output
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/incremental/<session_id>/edit', methods=['POST'])
+def incremental_edit(session_id):
+    try:
+        session = incremental_sessions.get(session_id)
+        if session is None:
+            return jsonify({
+                'success': False,
+                'error': 'Sesi tidak ditemukan atau sudah kadaluarsa'
+            }), 404
+        
+        # Edit diterapkan berurutan, masing-masing relatif terhadap hasil edit sebelumnya
+        diffs = []
+        for edit in request.get_json().get('edits', []):
+            diffs.append(session.apply_edit(
+                int(edit['offset']), int(edit.get('deleted', 0)), edit.get('inserted', '')
+            ))
+        
+        return jsonify({
+            'success': True,
+            'diffs': diffs,
+            'length': len(session.output)
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        })
+
+@app.route('/incremental/<session_id>', methods=['DELETE'])
+def incremental_end(session_id):
+    incremental_sessions.remove(session_id)
+    return jsonify({
+        'success': True
+    })
+
+def keygen_args():
+    """Tipe cipher, jumlah dan ukuran kunci dari query /keygen"""
+    size = request.args.get('size')
+    return (request.args.get('cipher_type', ''), int(request.args.get('count', 1)),
+            int(size) if size else None)
+
+def requested_key_letters() -> int:
+    """Jumlah huruf kunci yang diminta, 0 jika query tidak valid (ditolak di route)"""
+    try:
+        cipher_type, count, size = keygen_args()
+        return min(key_letters(cipher_type, count, size), app.config['MAX_KEYGEN_LETTERS'])
+    except ValueError:
+        return 0
+
+@app.route('/keygen')
+def keygen():
+    try:
+        cipher_type, count, size = keygen_args()
+        
+        if not 1 <= count <= app.config['MAX_KEYGEN_COUNT']:
+            return jsonify({
+                'success': False,
+                'error': f"Jumlah kunci harus antara 1 dan {app.config['MAX_KEYGEN_COUNT']}"
+            }), 400
+        if cipher_type == 'vigenere' and size and size > app.config['MAX_KEYGEN_VIGENERE_SIZE']:
+            return jsonify({
+                'success': False,
+                'error': f"Panjang kunci Vigenere maksimal {app.config['MAX_KEYGEN_VIGENERE_SIZE']}"
+            }), 400
+        if key_letters(cipher_type, count, size) > app.config['MAX_KEYGEN_LETTERS']:
+            return jsonify({
+                'success': False,
+                'error': f"Jumlah x ukuran kunci maksimal {app.config['MAX_KEYGEN_LETTERS']} huruf"
+            }), 400
+        
+        keys = key_pool.take(cipher_type, count, size)
+        return jsonify({
+            'success': True,
+            'cipher_type': cipher_type,
+            'keys': keys
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@app.route('/stats')
+def stats():
+    return jsonify({
+        'cache': result_cache.stats(),
+        'keygen': key_pool.stats(),
+        'memory': {
+            'budget': memory_budget.stats(),
+            'profile': memory_profiler.stats()
+        }
+    })
+
+@app.route('/upload/init', methods=['POST'])
+def upload_init():
+    try:
+        data = request.get_json()
+        cipher_type = data.get('cipher_type')
+        key = data.get('key', '')
+        file_name = data.get('file_name', 'file')
+        
+        if not cipher_type or not key or 'size' not in data:
+            return jsonify({
+                'success': False,
+                'error': 'Cipher type, key, dan ukuran file harus diisi'
+            }), 400
+        
+        cipher = get_cipher_instance(cipher_type, key)
+        upload = chunked_uploads.create(
+            file_name, int(data['size']), cipher_type, key, cipher,
+            int(data.get('chunk_size', UPLOAD_CHUNK_SIZE))
+        )
+        return jsonify({
+            'success': True,
+            'token': upload.token,
+            **upload.status()
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@app.route('/upload/<upload_id>/resume', methods=['POST'])
+def upload_resume(upload_id):
+    """Verifikasi kunci (PBKDF2) sekali dan kembalikan token upload untuk request berikutnya"""
+    try:
+        upload = chunked_uploads.get(upload_id)
+        if upload is None:
+            return jsonify({
+                'success': False,
+                'error': 'Upload tidak ditemukan atau sudah kadaluarsa'
+            }), 404
+        
+        token = upload.resume(request.headers.get('X-Cipher-Type', ''),
+                              unquote(request.headers.get('X-Cipher-Key', '')))
+        if token is None:
+            raise UploadError('Tipe cipher atau kunci tidak cocok dengan upload')
+        return jsonify({
+            'success': True,
+            'token': token,
+            **upload.status()
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+def get_upload(upload_id):
+    """
+    Upload beserta cipher dari header X-Upload-Token, X-Cipher-Type dan
+    X-Cipher-Key (kunci di-URL-encode). Token dicek tanpa PBKDF2.
+    """
+    upload = chunked_uploads.get(upload_id)
+    if upload is None:
+        return None, None
+    
+    cipher_type = request.headers.get('X-Cipher-Type', '')
+    key = unquote(request.headers.get('X-Cipher-Key', ''))
+    if not upload.check_token(request.headers.get('X-Upload-Token', ''), cipher_type, key):
+        raise UploadError('Token upload, tipe cipher atau kunci tidak cocok')
+    return upload, get_cipher_instance(cipher_type, key)
+
+@app.route('/upload/<upload_id>', methods=['GET'])
+def upload_status(upload_id):
+    try:
+        upload, _ = get_upload(upload_id)
+        if upload is None:
+            return jsonify({
+                'success': False,
+                'error': 'Upload tidak ditemukan atau sudah kadaluarsa'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            **upload.status()
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@app.route('/upload/<upload_id>/chunk/<int:index>', methods=['PUT'])
+def upload_chunk(upload_id, index):
+    try:
+        upload, cipher = get_upload(upload_id)
+        if upload is None:
+            return jsonify({
+                'success': False,
+                'error': 'Upload tidak ditemukan atau sudah kadaluarsa'
+            }), 404
+        
+        # Chunk langsung dienkripsi dan ditulis ke posisinya di file output
+        upload.write_chunk(index, request.get_data(cache=False), cipher)
+        return jsonify({
+            'success': True,
+            'index': index
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@app.route('/upload/<upload_id>/complete', methods=['POST'])
+def upload_complete(upload_id):
+    try:
+        upload, _ = get_upload(upload_id)
+        if upload is None:
+            return jsonify({
+                'success': False,
+                'error': 'Upload tidak ditemukan atau sudah kadaluarsa'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'message': 'File berhasil dienkripsi',
+            'file_path': upload.complete(),
+            'file_name': upload.state['file_name'] + '.dat'
+        })
+        
+    except Exception as e:
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 400
+
+@app.route('/upload/<upload_id>', methods=['DELETE'])
+def upload_abort(upload_id):
+    chunked_uploads.remove(upload_id)
+    return jsonify({
+        'success': True
+    })
+
 @app.route('/download/<path:filename>')
 def download_file(filename):
     return send_file(filename, as_attachment=True)
 
 def get_cipher_instance(cipher_type, key):
     """Mengembalikan instance cipher berdasarkan tipe"""
-    if cipher_type == 'shift':
-        return ShiftCipher(int(key) if key.isdigit() else 0)
-    elif cipher_type == 'substitution':
-        return SubstitutionCipher(key)
-    elif cipher_type == 'affine':
-        a, b = map(int, key.split(',')) if ',' in key else (1, 0)
-        return AffineCipher(a, b)
-    elif cipher_type == 'vigenere':
-        return VigenereCipher(key)
-    elif cipher_type == 'hill':
-        return HillCipher(key)
-    elif cipher_type == 'permutation':
-        return PermutationCipher(key)
-    else:
-        raise ValueError(f"Tipe cipher tidak valid: {cipher_type}")
+    return create_cipher(cipher_type, key)
 
 if __name__ == '__main__':
+    # Kalibrasi engine cipher sekali saat pertama kali dijalankan
+    if not os.path.exists(ENGINE_CONFIG_PATH):
+        from calibrate_engines import calibrate
+        save_engine_thresholds(calibrate(verbose=False))
+    
     app.run(debug=True, host='0.0.0.0', port=5000)
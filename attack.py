@@ -0,0 +1,291 @@
+"""
+Serangan kamus (dictionary attack) untuk kunci Vigenere dan Substitution
+
+Wordlist disimpan sebagai satu array kode huruf (0-25) yang disambung plus
+array offset, sehingga jutaan kata muat dalam beberapa MB dan bisa dikirim
+ke worker sekali saja. Untuk setiap batch kandidat:
+
+1. hanya prefix ciphertext (default 64 huruf) yang didekripsi, untuk semua
+   kandidat sekaligus sebagai satu operasi NumPy (kandidat x panjang prefix)
+2. skor cepat: jumlah log frekuensi huruf bahasa Inggris pada prefix
+3. sebagian kecil kandidat terbaik didekripsi penuh dan diberi skor log
+   peluang bigram bahasa Inggris
+
+Kunci Substitution dibentuk dari kata kunci: huruf unik kata tersebut lalu
+sisa alfabet secara urut (misalnya ZEBRA -> ZEBRACDFGHIJKLMNOPQSTUVWXY).
+
+Contoh:
+    python attack.py cipher.txt --cipher vigenere --wordlist words.txt
+"""
+
+import argparse
+import heapq
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from analysis import ENGLISH_FREQUENCIES, letter_codes
+from ciphers import process_context
+from registry import create_cipher
+
+ATTACK_CIPHERS = ('vigenere', 'substitution')
+DEFAULT_BATCH_SIZE = 4096
+DEFAULT_PREFIX_LENGTH = 64
+DEFAULT_MAX_LETTERS = 2000   # huruf ciphertext untuk skor penuh
+BATCHES_PER_TASK = 16
+
+LOG_FREQUENCIES = np.log(ENGLISH_FREQUENCIES).astype(np.float32)
+
+# Frekuensi (%) bigram paling umum dalam teks bahasa Inggris; bigram lain
+# diperkirakan dari perkalian frekuensi huruf
+COMMON_BIGRAMS = {
+    'TH': 3.56, 'HE': 3.07, 'IN': 2.43, 'ER': 2.05, 'AN': 1.99, 'RE': 1.85, 'ON': 1.76,
+    'AT': 1.49, 'EN': 1.45, 'ND': 1.35, 'TI': 1.34, 'ES': 1.34, 'OR': 1.28, 'TE': 1.20,
+    'OF': 1.17, 'ED': 1.17, 'IS': 1.13, 'IT': 1.12, 'AL': 1.09, 'AR': 1.07, 'ST': 1.05,
+    'TO': 1.04, 'NT': 1.04, 'NG': 0.95, 'SE': 0.93, 'HA': 0.93, 'AS': 0.87, 'OU': 0.87,
+    'IO': 0.83, 'LE': 0.83, 'VE': 0.83, 'CO': 0.79, 'ME': 0.79, 'DE': 0.76, 'HI': 0.76,
+    'RI': 0.73, 'RO': 0.73, 'IC': 0.70, 'NE': 0.69, 'EA': 0.69, 'RA': 0.69, 'CE': 0.65,
+}
+
+
+def _bigram_log_table() -> np.ndarray:
+    table = np.outer(ENGLISH_FREQUENCIES, ENGLISH_FREQUENCIES)
+    for bigram, percent in COMMON_BIGRAMS.items():
+        table[ord(bigram[0]) - 65, ord(bigram[1]) - 65] = percent / 100
+    return np.log(table).ravel()
+
+
+BIGRAM_LOG_TABLE = _bigram_log_table()
+
+
+class Wordlist:
+    """Daftar kata sebagai array kode huruf yang disambung plus offset"""
+
+    def __init__(self, data: np.ndarray, offsets: np.ndarray):
+        self.data = data
+        self.offsets = offsets
+
+    @classmethod
+    def from_bytes(cls, raw: bytes):
+        """Satu kata per baris; karakter selain huruf dibuang, baris kosong dilewati"""
+        raw = np.frombuffer(raw, dtype=np.uint8)
+        upper = raw & 0xDF
+        is_letter = (upper >= 65) & (upper <= 90)
+        is_newline = raw == 10
+
+        kept = np.where(is_letter, upper - 65, 255)[is_letter | is_newline]
+        # Batas kata: posisi newline dalam array yang sudah difilter
+        breaks = np.flatnonzero(kept == 255)
+        starts = np.concatenate([[0], breaks + 1])
+        ends = np.concatenate([breaks, [len(kept)]])
+        lengths = ends - starts
+
+        nonempty = lengths > 0
+        starts, lengths = starts[nonempty], lengths[nonempty]
+        data = kept[np.repeat(starts, lengths) + _positions_in_groups(lengths)]
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        return cls(data.astype(np.uint8), offsets)
+
+    @classmethod
+    def from_file(cls, path: str):
+        with open(path, 'rb') as f:
+            return cls.from_bytes(f.read())
+
+    @classmethod
+    def from_words(cls, words):
+        return cls.from_bytes('\n'.join(words).encode('ascii', 'ignore'))
+
+    @property
+    def lengths(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def word(self, index: int) -> str:
+        codes = self.data[self.offsets[index]:self.offsets[index + 1]]
+        return (codes + 65).tobytes().decode('ascii')
+
+
+def _positions_in_groups(lengths: np.ndarray) -> np.ndarray:
+    """[0..len0-1, 0..len1-1, ...] untuk grup dengan panjang lengths"""
+    total = int(lengths.sum())
+    group_starts = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+    return np.arange(total) - np.repeat(group_starts, lengths)
+
+
+def keyword_alphabet(word: str) -> str:
+    """Alfabet substitusi dari kata kunci: huruf unik kata lalu sisa alfabet"""
+    seen = dict.fromkeys(c for c in word.upper() if 'A' <= c <= 'Z')
+    rest = (c for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ' if c not in seen)
+    return ''.join(seen) + ''.join(rest)
+
+
+def _keyword_inverse(data: np.ndarray, offsets: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """
+    Tabel dekripsi (kandidat x 26) untuk alfabet kata kunci: huruf cipher x
+    didekripsi menjadi urutan x di dalam alfabet kunci
+    """
+    count = len(offsets)
+    positions = _positions_in_groups(lengths)
+    word_ids = np.repeat(np.arange(count), lengths)
+    codes = data[np.repeat(offsets, lengths) + positions]
+
+    # Huruf kata kunci diurutkan menurut kemunculan pertama, sisanya menurut alfabet
+    rank_key = np.tile(np.arange(1000, 1026, dtype=np.int32), (count, 1))
+    np.minimum.at(rank_key, (word_ids, codes), positions.astype(np.int32))
+    return np.argsort(np.argsort(rank_key, axis=1), axis=1).astype(np.uint8)
+
+
+def _decrypt_batch(cipher_type: str, data, offsets, lengths, ciphertext: np.ndarray) -> np.ndarray:
+    """Dekripsi ciphertext (kode 0-25) untuk banyak kunci sekaligus -> (kandidat x panjang)"""
+    if cipher_type == 'vigenere':
+        columns = np.arange(len(ciphertext))
+        key_stream = data[offsets[:, None] + columns[None, :] % lengths[:, None]]
+        return (ciphertext[None, :] + 26 - key_stream) % 26
+    return _keyword_inverse(data, offsets, lengths)[:, ciphertext]
+
+
+def _bigram_scores(plain: np.ndarray) -> np.ndarray:
+    """Rata-rata log peluang bigram bahasa Inggris per baris (makin besar makin mirip)"""
+    pairs = plain[:, :-1].astype(np.intp) * 26 + plain[:, 1:]
+    return BIGRAM_LOG_TABLE[pairs].mean(axis=1)
+
+
+_worker_state = {}
+
+
+def _init_worker(cipher_type, data, offsets, ciphertext, prefix_length, batch_size, keep_ratio, top):
+    """Simpan wordlist dan ciphertext di worker (dikirim sekali per process)"""
+    _worker_state.update(
+        cipher_type=cipher_type, data=data, offsets=offsets, ciphertext=ciphertext,
+        prefix=ciphertext[:prefix_length], batch_size=batch_size, keep_ratio=keep_ratio, top=top,
+    )
+
+
+def _attack_range(start: int, end: int) -> list:
+    """Worker: uji kandidat [start, end), mengembalikan top (skor, index)"""
+    state = _worker_state
+    best = []
+
+    for batch_start in range(start, end, state['batch_size']):
+        batch_end = min(end, batch_start + state['batch_size'])
+        offsets = state['offsets'][batch_start:batch_end]
+        lengths = state['offsets'][batch_start + 1:batch_end + 1] - offsets
+
+        # Tahap 1: skor cepat pada prefix untuk seluruh batch
+        plain = _decrypt_batch(state['cipher_type'], state['data'], offsets, lengths, state['prefix'])
+        scores = LOG_FREQUENCIES[plain].sum(axis=1)
+        keep = min(len(scores), max(state['top'], int(len(scores) * state['keep_ratio'])))
+        survivors = np.argpartition(-scores, keep - 1)[:keep]
+
+        # Tahap 2: skor bigram pada teks penuh untuk kandidat yang lolos
+        full = _decrypt_batch(state['cipher_type'], state['data'], offsets[survivors],
+                              lengths[survivors], state['ciphertext'])
+        for score, index in zip(_bigram_scores(full).tolist(), (survivors + batch_start).tolist()):
+            heapq.heappush(best, (score, -index))
+            if len(best) > state['top']:
+                heapq.heappop(best)
+
+    return [(score, -neg_index) for score, neg_index in best]
+
+
+def dictionary_attack(ciphertext: str, cipher_type: str, wordlist: Wordlist, top: int = 10,
+                      workers: int = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                      prefix_length: int = DEFAULT_PREFIX_LENGTH, keep_ratio: float = 0.02,
+                      max_letters: int = DEFAULT_MAX_LETTERS) -> dict:
+    """
+    Cari kunci berbasis kata dari wordlist untuk ciphertext
+
+    Args:
+        ciphertext (str): Teks terenkripsi
+        cipher_type (str): 'vigenere' atau 'substitution'
+        wordlist (Wordlist): Kandidat kata kunci
+        top (int): Jumlah kunci terbaik yang dikembalikan
+        workers (int): Jumlah process (default: jumlah core, 1 = tanpa pool)
+        batch_size (int): Jumlah kandidat per operasi vektor
+        prefix_length (int): Panjang prefix untuk skor cepat
+        keep_ratio (float): Porsi kandidat per batch yang diberi skor penuh
+
+    Returns:
+        dict: statistik serangan dan daftar kunci terbaik (skor bigram terbesar)
+    """
+    if cipher_type not in ATTACK_CIPHERS:
+        raise ValueError(f"Serangan kamus hanya untuk {', '.join(ATTACK_CIPHERS)}")
+
+    codes = letter_codes(ciphertext.encode('utf-8'))[:max_letters]
+    if len(codes) == 0:
+        raise ValueError("Ciphertext tidak mengandung huruf")
+
+    count = len(wordlist)
+    workers = workers or os.cpu_count() or 1
+    task_size = batch_size * BATCHES_PER_TASK
+    ranges = [(start, min(count, start + task_size)) for start in range(0, count, task_size)]
+    initargs = (cipher_type, wordlist.data, wordlist.offsets, codes, prefix_length,
+                batch_size, keep_ratio, top)
+
+    started = time.perf_counter()
+    if workers == 1 or len(ranges) <= 1:
+        _init_worker(*initargs)
+        partials = [_attack_range(start, end) for start, end in ranges]
+    else:
+        # Sama seperti pool lain: jangan fork process yang mungkin punya thread
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                 initargs=initargs, mp_context=process_context()) as pool:
+            partials = list(pool.map(_attack_range, *zip(*ranges)))
+    seconds = time.perf_counter() - started
+
+    # Skor sama (misalnya KEY dan KEYKEY): kata yang lebih dulu di wordlist menang
+    best = heapq.nlargest(top, (item for partial in partials for item in partial),
+                          key=lambda item: (item[0], -item[1]))
+    preview = ciphertext[:60]
+    results = []
+    for score, index in best:
+        keyword = wordlist.word(index)
+        key = keyword if cipher_type == 'vigenere' else keyword_alphabet(keyword)
+        results.append({
+            'keyword': keyword,
+            'key': key,
+            'score': round(score, 4),
+            'preview': create_cipher(cipher_type, key).decrypt(preview),
+        })
+
+    return {
+        'cipher_type': cipher_type,
+        'candidates': count,
+        'workers': workers,
+        'seconds': round(seconds, 6),
+        'candidates_per_second': round(count / seconds) if seconds > 0 else 0,
+        'results': results,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Serangan kamus untuk kunci Vigenere/Substitution')
+    parser.add_argument('ciphertext', help='File berisi ciphertext')
+    parser.add_argument('--cipher', required=True, choices=ATTACK_CIPHERS)
+    parser.add_argument('--wordlist', required=True, help='File wordlist, satu kata per baris')
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--workers', type=int, default=None, help='Jumlah worker (default: jumlah core)')
+    parser.add_argument('--batch-size', type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument('--prefix', type=int, default=DEFAULT_PREFIX_LENGTH,
+                        help='Panjang prefix ciphertext untuk skor cepat')
+    args = parser.parse_args()
+
+    with open(args.ciphertext, 'r', encoding='utf-8', errors='replace') as f:
+        ciphertext = f.read()
+    wordlist = Wordlist.from_file(args.wordlist)
+
+    report = dictionary_attack(ciphertext, args.cipher, wordlist, args.top, args.workers,
+                               args.batch_size, args.prefix)
+
+    print(f"Kandidat: {report['candidates']} ({report['workers']} worker)")
+    print(f"Waktu: {report['seconds']:.2f} detik ({report['candidates_per_second']} kandidat/detik)")
+    for rank, result in enumerate(report['results'], 1):
+        print(f"{rank:2d}. {result['keyword']:<20} skor={result['score']:<9} {result['preview']}")
+
+
+if __name__ == "__main__":
+    main()
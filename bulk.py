@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Enkripsi massal (bulk) untuk direktori atau arsip zip/tar
+
+File kecil dikelompokkan menjadi satu task, file besar dipecah per chunk,
+dan semua task dijalankan di pool thread/process sebanyak jumlah core.
+Setiap file ditulis dalam format kontainer (lihat container.py), lalu
+hasilnya dikumpulkan ke direktori atau arsip output beserta manifest.json
+yang mencatat ukuran dan waktu proses setiap file.
+
+Contoh:
+    python bulk.py dokumen/ hasil.zip --cipher vigenere --key KEYWORD
+"""
+
+import argparse
+import io
+import json
+import os
+import shutil
+import tarfile
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from registry import create_cipher
+from ciphers import process_context
+from container import ContainerWriter, DEFAULT_CHUNK_SIZE, encrypt_chunk, make_key_check
+
+SMALL_FILE_SIZE = 256 * 1024       # file di bawah ukuran ini dikelompokkan
+BATCH_BYTES = 4 * 1024 * 1024      # total ukuran file kecil per task
+READ_BUFFER = 1024 * 1024          # buffer baca/tulis untuk arsip
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tar.xz')
+
+_worker_ciphers = {}
+
+
+def _worker_cipher(cipher_type, key):
+    """Instance cipher per worker, dibuat sekali lalu di-cache"""
+    cipher = _worker_ciphers.get((cipher_type, key))
+    if cipher is None:
+        cipher = _worker_ciphers[(cipher_type, key)] = create_cipher(cipher_type, key)
+    return cipher
+
+
+def _encrypt_batch(cipher_type, key, chunk_size, files, key_check):
+    """Worker: enkripsi beberapa file kecil menjadi kontainer di memori"""
+    cipher = _worker_cipher(cipher_type, key)
+    results = []
+
+    for rel_path, path in files:
+        start = time.perf_counter()
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        out = io.BytesIO()
+        with ContainerWriter(out, cipher_type, key, cipher, chunk_size, key_check) as writer:
+            writer.write(data)
+
+        results.append((rel_path, out.getvalue(), len(data), time.perf_counter() - start))
+
+    return results
+
+
+def _encrypt_range(cipher_type, key, path, offset, length):
+    """Worker: baca dan enkripsi satu chunk dari file besar"""
+    cipher = _worker_cipher(cipher_type, key)
+    start = time.perf_counter()
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.pread(fd, length, offset)
+    finally:
+        os.close(fd)
+
+    payload, checksum = encrypt_chunk(cipher, data)
+    return payload, checksum, len(data), time.perf_counter() - start
+
+
+def is_archive(path):
+    """Cek apakah path adalah arsip zip/tar berdasarkan ekstensi"""
+    return path.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _safe_target(root, name):
+    """Path tujuan ekstraksi, menolak path absolut atau keluar dari root"""
+    target = os.path.realpath(os.path.join(root, name))
+    if os.path.commonpath([target, os.path.realpath(root)]) != os.path.realpath(root):
+        raise ValueError(f"Path tidak aman di dalam arsip: {name}")
+    return target
+
+
+def _check_archive_limits(sizes, max_bytes, max_files):
+    """Tolak arsip yang ukuran total (menurut header) atau jumlah filenya melebihi batas"""
+    if max_files is not None and len(sizes) > max_files:
+        raise ValueError(f"Arsip berisi {len(sizes)} file, maksimal {max_files}")
+    total = sum(sizes)
+    if max_bytes is not None and total > max_bytes:
+        raise ValueError(f"Ukuran isi arsip {total} byte, maksimal {max_bytes}")
+
+
+def _extract_members(members, open_member, dest, max_bytes):
+    """Tulis (member, nama) ke dest sambil menghitung byte yang benar-benar ditulis"""
+    written = 0
+    for member, name in members:
+        target = _safe_target(dest, name)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        with open_member(member) as src, open(target, 'wb') as dst:
+            for block in iter(lambda: src.read(READ_BUFFER), b''):
+                written += len(block)
+                # Header arsip bisa berbohong tentang ukuran isi
+                if max_bytes is not None and written > max_bytes:
+                    raise ValueError(f"Isi arsip melebihi batas {max_bytes} byte")
+                dst.write(block)
+
+
+def extract_archive(path, dest, max_bytes=None, max_files=None):
+    """
+    Ekstrak arsip zip/tar ke dest (hanya file reguler)
+
+    Ukuran total dan jumlah file dicek dari header sebelum ekstraksi, lalu
+    byte yang ditulis juga dihitung, sehingga zip bomb ditolak sebelum
+    memenuhi disk. None berarti tanpa batas.
+    """
+    if zipfile.is_zipfile(path):
+        with zipfile.ZipFile(path) as zf:
+            members = [info for info in zf.infolist() if not info.is_dir()]
+            _check_archive_limits([info.file_size for info in members], max_bytes, max_files)
+            _extract_members([(info, info.filename) for info in members], zf.open, dest, max_bytes)
+    elif tarfile.is_tarfile(path):
+        with tarfile.open(path) as tf:
+            members = [member for member in tf.getmembers() if member.isfile()]
+            _check_archive_limits([member.size for member in members], max_bytes, max_files)
+            _extract_members([(member, member.name) for member in members], tf.extractfile,
+                             dest, max_bytes)
+    else:
+        raise ValueError("Format arsip tidak didukung (gunakan zip atau tar)")
+
+
+def walk_files(root):
+    """Daftar (path relatif, path absolut, ukuran) semua file di bawah root"""
+    files = []
+    for dirpath, _, filenames in os.walk(root):
+        for name in sorted(filenames):
+            path = os.path.join(dirpath, name)
+            if os.path.isfile(path) and not os.path.islink(path):
+                rel_path = os.path.relpath(path, root).replace(os.sep, '/')
+                files.append((rel_path, path, os.path.getsize(path)))
+    files.sort()
+    return files
+
+
+def _plan_tasks(files, chunk_size):
+    """Kelompokkan file kecil per batch dan pecah file besar per chunk"""
+    tasks = []
+    batch, batch_bytes = [], 0
+
+    for rel_path, path, size in files:
+        if size < SMALL_FILE_SIZE:
+            batch.append((rel_path, path))
+            batch_bytes += size
+            if batch_bytes >= BATCH_BYTES:
+                tasks.append(('batch', batch))
+                batch, batch_bytes = [], 0
+        else:
+            count = max(1, -(-size // chunk_size))
+            for index in range(count):
+                offset = index * chunk_size
+                tasks.append(('chunk', rel_path, path, index, count, offset, min(chunk_size, size - offset)))
+
+    if batch:
+        tasks.append(('batch', batch))
+    return tasks
+
+
+def encrypt_tree(root, out_dir, cipher_type, key, workers=None, executor='process',
+                 chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Enkripsi semua file di bawah root ke out_dir (file .dat per file)
+
+    Returns:
+        list: entri manifest per file
+    """
+    cipher = create_cipher(cipher_type, key)
+    workers = workers or os.cpu_count() or 1
+    # Samakan ukuran chunk dengan yang dipakai ContainerWriter
+    block = getattr(cipher, 'byte_block_size', 1)
+    chunk_size = max(block, chunk_size - chunk_size % block)
+    # Satu salt fingerprint untuk semua file dalam satu run (PBKDF2 dihitung sekali)
+    key_check = make_key_check(cipher_type, key)
+
+    files = walk_files(root)
+    manifest = []
+
+    def output_path(rel_path):
+        path = os.path.join(out_dir, rel_path + '.dat')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        return path
+
+    pool_class = ProcessPoolExecutor if executor == 'process' else ThreadPoolExecutor
+    tasks = iter(_plan_tasks(files, chunk_size))
+    # Batasi task yang berjalan agar hasil chunk tidak menumpuk di memori
+    max_inflight = workers * 2
+    inflight = {}
+    open_files = {}
+
+    def submit(pool, task):
+        if task[0] == 'batch':
+            future = pool.submit(_encrypt_batch, cipher_type, key, chunk_size, task[1], key_check)
+        else:
+            _, rel_path, path, index, count, offset, length = task
+            if rel_path not in open_files:
+                out = open(output_path(rel_path), 'wb')
+                open_files[rel_path] = {
+                    'out': out, 'writer': ContainerWriter(out, cipher_type, key, cipher, chunk_size, key_check),
+                    'pending': {}, 'next': 0, 'count': count, 'size': 0,
+                    'seconds': 0.0, 'started': time.perf_counter(),
+                }
+            future = pool.submit(_encrypt_range, cipher_type, key, path, offset, length)
+        inflight[future] = task
+
+    def handle(task, result):
+        if task[0] == 'batch':
+            for rel_path, data, size, seconds in result:
+                with open(output_path(rel_path), 'wb') as f:
+                    f.write(data)
+                manifest.append({
+                    'path': rel_path, 'output': rel_path + '.dat', 'size': size,
+                    'encrypted_size': len(data), 'mode': 'batch', 'seconds': round(seconds, 6),
+                })
+            return
+
+        rel_path, index = task[1], task[3]
+        state = open_files[rel_path]
+        state['pending'][index] = result
+
+        # Tulis chunk yang sudah berurutan
+        while state['next'] in state['pending']:
+            payload, checksum, plain_length, seconds = state['pending'].pop(state['next'])
+            state['writer'].append_encrypted(payload, plain_length, checksum)
+            state['size'] += plain_length
+            state['seconds'] += seconds
+            state['next'] += 1
+
+        if state['next'] == state['count']:
+            state['writer'].close()
+            encrypted_size = state['out'].tell()
+            state['out'].close()
+            del open_files[rel_path]
+            manifest.append({
+                'path': rel_path, 'output': rel_path + '.dat', 'size': state['size'],
+                'encrypted_size': encrypted_size, 'mode': 'chunked', 'chunks': state['count'],
+                'seconds': round(state['seconds'], 6),
+                'wall_seconds': round(time.perf_counter() - state['started'], 6),
+            })
+
+    try:
+        # /bulk/encrypt memanggil ini dari thread request, jadi jangan fork langsung
+        pool_options = {'mp_context': process_context()} if pool_class is ProcessPoolExecutor else {}
+        with pool_class(max_workers=workers, **pool_options) as pool:
+            for task in tasks:
+                submit(pool, task)
+                if len(inflight) >= max_inflight:
+                    done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        handle(inflight.pop(future), future.result())
+
+            while inflight:
+                done, _ = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    handle(inflight.pop(future), future.result())
+    finally:
+        for state in open_files.values():
+            state['out'].close()
+
+    manifest.sort(key=lambda entry: entry['path'])
+    return manifest
+
+
+def copy_file_range(src_fd, dst_fd, length):
+    """
+    Salin length byte dari awal src_fd ke posisi saat ini di dst_fd di dalam
+    kernel (copy_file_range / sendfile), fallback ke pread/write
+    """
+    offset = 0
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while offset < length:
+                copied = os.copy_file_range(src_fd, dst_fd, length - offset, offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            pass
+    if offset < length and hasattr(os, 'sendfile'):
+        try:
+            while offset < length:
+                copied = os.sendfile(dst_fd, src_fd, offset, length - offset)
+                if copied == 0:
+                    break
+                offset += copied
+        except OSError:
+            pass
+    while offset < length:
+        data = os.pread(src_fd, min(length - offset, READ_BUFFER), offset)
+        if not data:
+            raise ValueError('File sumber lebih pendek dari yang diharapkan')
+        os.write(dst_fd, data)
+        offset += len(data)
+
+
+def _write_plain_tar(src_dir, archive_path):
+    """
+    Tar tanpa kompresi: header ditulis oleh tarfile, isi file (kontainer yang
+    sudah jadi) disalin apa adanya di kernel tanpa melewati Python
+    """
+    with open(archive_path, 'wb') as out:
+        for rel_path, path, size in walk_files(src_dir):
+            info = tarfile.TarInfo(rel_path)
+            info.size = size
+            info.mtime = os.path.getmtime(path)
+            out.write(info.tobuf(tarfile.PAX_FORMAT))
+            out.flush()
+            with open(path, 'rb') as src:
+                copy_file_range(src.fileno(), out.fileno(), size)
+            # Sinkronkan posisi file object dengan posisi file descriptor
+            out.seek(0, os.SEEK_END)
+            out.write(bytes(-size % tarfile.BLOCKSIZE))
+        # Dua blok nol penutup, lalu dibulatkan ke ukuran record
+        end = out.tell() + 2 * tarfile.BLOCKSIZE
+        out.write(bytes(2 * tarfile.BLOCKSIZE + -end % tarfile.RECORDSIZE))
+
+
+def write_archive(src_dir, archive_path):
+    """Kumpulkan isi src_dir ke arsip zip atau tar"""
+    if archive_path.lower().endswith('.tar'):
+        _write_plain_tar(src_dir, archive_path)
+    elif archive_path.lower().endswith('.zip'):
+        # Ciphertext tidak bisa dikompresi, cukup disimpan
+        with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_STORED, allowZip64=True) as zf:
+            for rel_path, path, _ in walk_files(src_dir):
+                with open(path, 'rb') as src, zf.open(rel_path, 'w', force_zip64=True) as dst:
+                    shutil.copyfileobj(src, dst, READ_BUFFER)
+    else:
+        mode = 'w'
+        for suffix, compression in (('.gz', 'gz'), ('.tgz', 'gz'), ('.bz2', 'bz2'), ('.xz', 'xz')):
+            if archive_path.lower().endswith(suffix):
+                mode = f'w:{compression}'
+        with tarfile.open(archive_path, mode) as tf:
+            for rel_path, path, _ in walk_files(src_dir):
+                tf.add(path, arcname=rel_path)
+
+
+def bulk_encrypt(source, output, cipher_type, key, workers=None, executor='process',
+                 chunk_size=DEFAULT_CHUNK_SIZE, max_extract_bytes=None, max_extract_files=None):
+    """
+    Enkripsi direktori atau arsip source ke output
+
+    Args:
+        source (str): Direktori atau arsip zip/tar input
+        output (str): Direktori output, atau arsip jika berakhiran .zip/.tar
+        cipher_type (str): Tipe cipher
+        key (str): Kunci cipher
+        workers (int): Jumlah worker (default: jumlah core)
+        executor (str): 'process' atau 'thread'
+        chunk_size (int): Ukuran chunk untuk file besar
+        max_extract_bytes (int): Batas total ukuran isi arsip (None: tanpa batas)
+        max_extract_files (int): Batas jumlah file dalam arsip (None: tanpa batas)
+
+    Returns:
+        dict: manifest hasil enkripsi
+    """
+    started = time.perf_counter()
+    workers = workers or os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        if os.path.isdir(source):
+            root = source
+        else:
+            root = os.path.join(work_dir, 'input')
+            extract_archive(source, root, max_extract_bytes, max_extract_files)
+
+        archive_output = is_archive(output)
+        out_dir = os.path.join(work_dir, 'output') if archive_output else output
+        os.makedirs(out_dir, exist_ok=True)
+
+        files = encrypt_tree(root, out_dir, cipher_type, key, workers, executor, chunk_size)
+        manifest = {
+            'cipher_type': cipher_type,
+            'workers': workers,
+            'executor': executor,
+            'chunk_size': chunk_size,
+            'file_count': len(files),
+            'total_bytes': sum(entry['size'] for entry in files),
+            'total_seconds': round(time.perf_counter() - started, 6),
+            'files': files,
+        }
+        with open(os.path.join(out_dir, 'manifest.json'), 'w') as f:
+            json.dump(manifest, f, indent=2)
+
+        if archive_output:
+            write_archive(out_dir, output)
+
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Enkripsi massal direktori atau arsip')
+    parser.add_argument('source', help='Direktori atau arsip zip/tar input')
+    parser.add_argument('output', help='Direktori output atau arsip (.zip/.tar/.tar.gz)')
+    parser.add_argument('--cipher', required=True, help='Tipe cipher (shift, vigenere, hill, ...)')
+    parser.add_argument('--key', required=True, help='Kunci cipher')
+    parser.add_argument('--workers', type=int, default=None, help='Jumlah worker (default: jumlah core)')
+    parser.add_argument('--executor', choices=['process', 'thread'], default='process')
+    parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument('--max-extract-bytes', type=int, default=None,
+                        help='Batas total ukuran isi arsip input (default: tanpa batas)')
+    parser.add_argument('--max-extract-files', type=int, default=None,
+                        help='Batas jumlah file dalam arsip input (default: tanpa batas)')
+    args = parser.parse_args()
+
+    manifest = bulk_encrypt(args.source, args.output, args.cipher, args.key,
+                            args.workers, args.executor, args.chunk_size,
+                            args.max_extract_bytes, args.max_extract_files)
+
+    print(f"File terenkripsi: {manifest['file_count']}")
+    print(f"Total ukuran: {manifest['total_bytes']} bytes")
+    print(f"Waktu total: {manifest['total_seconds']:.2f} detik")
+    print(f"Output: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""
+Cache hasil enkripsi/dekripsi teks
+
+Kunci cache adalah hash BLAKE2b dari (tipe cipher, kunci yang sudah
+dinormalisasi, arah, teks). Cache memakai batas ukuran dalam byte (bukan
+jumlah entri) dengan eviction LRU, serta tier disk opsional untuk hasil
+berukuran besar. Teks di atas bypass_threshold tidak di-cache sama sekali.
+
+Tier disk hanya berlaku selama process hidup: index-nya ada di memori, jadi
+file .cache (dan file sementara) sisa process sebelumnya dihapus saat start.
+"""
+
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+# Overhead tetap per entri memori di luar kunci dan nilai: tuple (hasil,
+# ukuran, panjang UTF-8), dua int, dan slot dict + node OrderedDict (diukur
+# dengan tracemalloc, ~220 byte di CPython 3.11)
+ENTRY_OVERHEAD = 224
+
+
+def make_cache_key(cipher_type: str, normalized_key: str, direction: str, text: str) -> str:
+    """Hash cepat dari semua parameter yang menentukan hasil cipher"""
+    digest = hashlib.blake2b(digest_size=16)
+    for part in (cipher_type, normalized_key, direction):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    digest.update(text.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Cache LRU berbasis ukuran byte dengan tier disk opsional"""
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, disk_dir: str = None,
+                 disk_max_bytes: int = 512 * 1024 * 1024, disk_threshold: int = 256 * 1024,
+                 bypass_threshold: int = 8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.disk_threshold = disk_threshold
+        self.bypass_threshold = bypass_threshold
+
+        self._memory = OrderedDict()  # key -> (hasil, ukuran, panjang UTF-8)
+        self._memory_bytes = 0
+        self._disk = OrderedDict()    # key -> ukuran file
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._sweep_disk()
+
+    def should_bypass(self, text: str) -> bool:
+        """Teks terlalu besar tidak di-cache"""
+        if len(text) > self.bypass_threshold:
+            with self._lock:
+                self.bypassed += 1
+            return True
+        return False
+
+    def get(self, key: str):
+        """Ambil hasil dari cache, None jika tidak ada"""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.bytes_saved += entry[2]
+                return entry[0]
+
+            if key in self._disk:
+                self._disk.move_to_end(key)
+            else:
+                self.misses += 1
+                return None
+
+        try:
+            with open(self._disk_path(key), 'rb') as f:
+                data = f.read()
+        except OSError:
+            with self._lock:
+                self._drop_disk(key)
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+            self.disk_hits += 1
+            self.bytes_saved += len(data)
+        return data.decode('utf-8', 'surrogatepass')
+
+    def put(self, key: str, value: str):
+        """Simpan hasil ke memori, atau ke disk jika besar dan tier disk aktif"""
+        if self.disk_dir and sys.getsizeof(value) >= self.disk_threshold:
+            self._put_disk(key, value)
+            return
+
+        # Yang dihitung ke budget: nilai, string kunci, dan overhead entri
+        size = sys.getsizeof(value) + sys.getsizeof(key) + ENTRY_OVERHEAD
+        if size > self.max_bytes:
+            return
+        # Dihitung sekali di sini agar bytes_saved tidak perlu encode saat hit
+        encoded_length = len(value) if value.isascii() else len(value.encode('utf-8', 'surrogatepass'))
+
+        with self._lock:
+            old = self._memory.pop(key, None)
+            if old is not None:
+                self._memory_bytes -= old[1]
+            self._memory[key] = (value, size, encoded_length)
+            self._memory_bytes += size
+
+            while self._memory_bytes > self.max_bytes:
+                _, (_, evicted_size, _) = self._memory.popitem(last=False)
+                self._memory_bytes -= evicted_size
+                self.evictions += 1
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key + '.cache')
+
+    def _sweep_disk(self):
+        """Hapus file cache sisa process sebelumnya (tidak ada di index)"""
+        for name in os.listdir(self.disk_dir):
+            if name.endswith(('.cache', '.tmp')):
+                try:
+                    os.remove(os.path.join(self.disk_dir, name))
+                except OSError:
+                    pass
+
+    def _put_disk(self, key: str, value: str):
+        data = value.encode('utf-8', 'surrogatepass')
+        if len(data) > self.disk_max_bytes:
+            return
+
+        # Tulis ke file sementara lalu rename agar pembaca tidak melihat file setengah jadi
+        path = self._disk_path(key)
+        temp_path = f'{path}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'wb') as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+        with self._lock:
+            if key in self._disk:
+                self._disk_bytes -= self._disk[key]
+            self._disk[key] = len(data)
+            self._disk_bytes += len(data)
+
+            while self._disk_bytes > self.disk_max_bytes:
+                evicted_key = next(iter(self._disk))
+                self._drop_disk(evicted_key)
+                self.evictions += 1
+
+    def _drop_disk(self, key: str):
+        size = self._disk.pop(key, None)
+        if size is None:
+            return
+        self._disk_bytes -= size
+        try:
+            os.remove(self._disk_path(key))
+        except OSError:
+            pass
+
+    def clear(self):
+        """Kosongkan cache memori dan disk"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+            for key in list(self._disk):
+                self._drop_disk(key)
+
+    def stats(self) -> dict:
+        """Statistik cache untuk tuning"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'bypassed': self.bypassed,
+                'evictions': self.evictions,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'bytes_saved': self.bytes_saved,
+                'memory_entries': len(self._memory),
+                'memory_bytes': self._memory_bytes,
+                'memory_max_bytes': self.max_bytes,
+                'disk_entries': len(self._disk),
+                'disk_bytes': self._disk_bytes,
+                'disk_max_bytes': self.disk_max_bytes if self.disk_dir else 0,
+            }
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Script untuk kalibrasi engine cipher
+Mengukur kecepatan setiap engine (scalar, translate, numpy, process) pada
+berbagai panjang teks, lalu menyimpan titik crossover ke file konfigurasi
+yang dibaca oleh BaseCipher saat memilih engine.
+"""
+
+import random
+import time
+
+from ciphers import (
+    ShiftCipher, SubstitutionCipher, AffineCipher,
+    VigenereCipher, HillCipher, PermutationCipher,
+    ENGINE_CONFIG_PATH, save_engine_thresholds
+)
+
+# Panjang teks yang diuji untuk engine translate/numpy dan engine process
+SIZES = [16, 64, 256, 1024, 4096, 16384, 65536]
+PROCESS_SIZES = [1024 * 1024, 4 * 1024 * 1024]
+
+def sample_ciphers():
+    """Instance contoh untuk setiap tipe cipher"""
+    return [
+        ShiftCipher(3),
+        SubstitutionCipher("ZYXWVUTSRQPONMLKJIHGFEDCBA"),
+        AffineCipher(5, 8),
+        VigenereCipher("KEYWORD"),
+        HillCipher("GYBNQKURP"),
+        PermutationCipher("2,0,1"),
+    ]
+
+def sample_text(length):
+    """Teks acak berisi huruf, spasi dan tanda baca"""
+    chars = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz     .,'
+    return ''.join(random.choices(chars, k=length))
+
+def measure(cipher, engine, text, repeat=3):
+    """Waktu terbaik (detik) untuk satu engine"""
+    func = getattr(cipher, f'_encrypt_{engine}')
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def find_crossover(cipher, engine, baseline_engines, sizes):
+    """
+    Panjang teks terkecil di mana engine lebih cepat dari engine lain
+    untuk panjang tersebut dan semua panjang yang lebih besar
+
+    Returns:
+        int atau None jika engine tidak pernah lebih cepat
+    """
+    crossover = None
+    for size in reversed(sizes):
+        text = sample_text(size)
+        engine_time = measure(cipher, engine, text)
+        baseline_time = min(measure(cipher, other, text) for other in baseline_engines)
+        if engine_time >= baseline_time:
+            break
+        crossover = size
+    return crossover
+
+def calibrate(verbose=True):
+    """Kalibrasi semua cipher dan kembalikan threshold per engine"""
+    thresholds = {}
+
+    for cipher in sample_ciphers():
+        result = {}
+        in_process = [e for e in cipher.engines if e != 'process']
+
+        for engine in in_process[1:]:
+            result[engine] = find_crossover(cipher, engine, ['scalar'], SIZES)
+
+        if 'process' in cipher.engines:
+            # Bandingkan hanya dengan engine tercepat untuk teks besar
+            result['process'] = find_crossover(cipher, 'process', in_process[-1:], PROCESS_SIZES)
+
+        thresholds[cipher.name] = result
+        if verbose:
+            print(f"{cipher.name}: {result}")
+
+    return thresholds
+
+if __name__ == "__main__":
+    print("Kalibrasi engine cipher")
+    print("=" * 50)
+
+    thresholds = calibrate()
+    save_engine_thresholds(thresholds)
+
+    print(f"Konfigurasi disimpan ke: {ENGINE_CONFIG_PATH}")
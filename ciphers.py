@@ -1,15 +1,225 @@
+from __future__ import annotations
+
 import re
-import numpy as np
+import os
+import json
+import logging
+import threading
+import importlib
 from typing import List, Union
-import random
 import string
 
+logger = logging.getLogger(__name__)
+
+class _LazyModule:
+    """Modul yang baru di-import saat atributnya pertama kali dipakai"""
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+# NumPy hanya di-load saat dipakai (Hill, engine numpy), sehingga cipher
+# scalar seperti ShiftCipher tidak menanggung waktu import NumPy
+np = _LazyModule('numpy')
+
+# File konfigurasi hasil kalibrasi engine (lihat calibrate_engines.py)
+ENGINE_CONFIG_PATH = os.environ.get(
+    'KRIPTO_ENGINE_CONFIG',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), 'engine_config.json')
+)
+# Set KRIPTO_ENGINE_DEBUG=1 untuk mencatat engine yang dipakai setiap panggilan
+ENGINE_DEBUG = os.environ.get('KRIPTO_ENGINE_DEBUG', '') not in ('', '0')
+if ENGINE_DEBUG:
+    logger.setLevel(logging.DEBUG)
+    if not logging.getLogger().handlers:
+        logger.addHandler(logging.StreamHandler())
+
+# Panjang teks minimum agar sebuah engine dipakai, None berarti tidak pernah
+DEFAULT_ENGINE_THRESHOLDS = {
+    'translate': 0,
+    'numpy': 1024,
+    'process': 8 * 1024 * 1024,
+}
+
+# Ukuran batch (byte) untuk perkalian matrix Hill pada mode biner
+HILL_BYTE_BATCH = 4 * 1024 * 1024
+
+_engine_thresholds = None
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+def load_engine_thresholds(path: str = None) -> dict:
+    """Baca threshold engine per cipher dari file konfigurasi"""
+    global _engine_thresholds
+    try:
+        with open(path or ENGINE_CONFIG_PATH) as f:
+            _engine_thresholds = json.load(f).get('thresholds', {})
+    except (OSError, ValueError):
+        _engine_thresholds = {}
+    return _engine_thresholds
+
+def save_engine_thresholds(thresholds: dict, path: str = None):
+    """Simpan threshold engine per cipher ke file konfigurasi"""
+    global _engine_thresholds
+    with open(path or ENGINE_CONFIG_PATH, 'w') as f:
+        json.dump({'version': 1, 'thresholds': thresholds}, f, indent=2, sort_keys=True)
+    _engine_thresholds = thresholds
+
+def get_engine_threshold(cipher_name: str, engine: str):
+    """Threshold untuk kombinasi cipher dan engine"""
+    if _engine_thresholds is None:
+        load_engine_thresholds()
+    per_cipher = _engine_thresholds.get(cipher_name, {})
+    if engine in per_cipher:
+        return per_cipher[engine]
+    return DEFAULT_ENGINE_THRESHOLDS.get(engine)
+
+def process_context():
+    """Konteks multiprocessing yang aman dipakai dari process multi-thread"""
+    import multiprocessing
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+def _get_process_pool():
+    """
+    Process pool bersama untuk engine multi-process
+
+    Pool bisa dibuat dari thread request Flask saat thread lain masih
+    berjalan, jadi worker tidak di-fork langsung dari process ini (fork di
+    process multi-thread bisa deadlock) melainkan lewat forkserver, atau
+    spawn di platform tanpa forkserver.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            import atexit
+            from concurrent.futures import ProcessPoolExecutor
+            
+            _process_pool = ProcessPoolExecutor(max_workers=os.cpu_count(), mp_context=process_context())
+            atexit.register(shutdown_process_pool)
+        return _process_pool
+
+def shutdown_process_pool():
+    """Hentikan process pool engine (dipanggil otomatis saat exit)"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is not None:
+            _process_pool.shutdown(wait=True, cancel_futures=True)
+            _process_pool = None
+
+def _run_in_process(cipher, direction: str, text: str) -> str:
+    """Dijalankan di worker: proses satu potongan tanpa engine process"""
+    return cipher._dispatch(direction, text, allow_process=False)
+
 class BaseCipher:
     """Base class untuk semua cipher"""
     
+    # Nama cipher, dipakai sebagai kunci konfigurasi engine
+    name = 'base'
+    # Engine yang tersedia, urut dari yang paling cocok untuk teks pendek
+    engines = ('scalar', 'process')
+    # False jika hasil tidak hanya bergantung pada kunci (misalnya kunci acak)
+    deterministic = True
+    
     def __init__(self):
         self.alphabet = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
         self.alphabet_lower = 'abcdefghijklmnopqrstuvwxyz'
+        self.last_engine = None
+    
+    def normalized_key(self) -> str:
+        """Representasi kanonik kunci, misalnya untuk kunci cache"""
+        raise NotImplementedError
+    
+    def encrypt(self, text: str) -> str:
+        """Enkripsi teks menggunakan engine yang paling sesuai"""
+        return self._dispatch('encrypt', text)
+    
+    def decrypt(self, text: str) -> str:
+        """Dekripsi teks menggunakan engine yang paling sesuai"""
+        return self._dispatch('decrypt', text)
+    
+    def select_engine(self, text: str, allow_process: bool = True) -> str:
+        """Pilih engine berdasarkan panjang teks dan tipe cipher"""
+        length = len(text)
+        selected = 'scalar'
+        
+        for engine in self.engines:
+            if engine == 'scalar' or (engine == 'process' and not allow_process):
+                continue
+            threshold = get_engine_threshold(self.name, engine)
+            if threshold is None or length < threshold:
+                continue
+            # Engine translate dan numpy hanya menangani teks ASCII
+            if engine in ('translate', 'numpy') and not text.isascii():
+                continue
+            selected = engine
+        
+        return selected
+    
+    def _dispatch(self, direction: str, text: str, allow_process: bool = True) -> str:
+        engine = self.select_engine(text, allow_process)
+        self.last_engine = engine
+        if ENGINE_DEBUG:
+            logger.debug('%s.%s: %d karakter -> engine %s', type(self).__name__, direction, len(text), engine)
+        return getattr(self, f'_{direction}_{engine}')(text)
+    
+    def _encrypt_translate(self, text: str) -> str:
+        return text.translate(self._translate_table('encrypt'))
+    
+    def _decrypt_translate(self, text: str) -> str:
+        return text.translate(self._translate_table('decrypt'))
+    
+    def _translate_table(self, direction: str) -> dict:
+        """Tabel str.translate untuk huruf ASCII, dibangun dari engine scalar"""
+        tables = self.__dict__.setdefault('_translate_tables', {})
+        if direction not in tables:
+            func = getattr(self, f'_{direction}_scalar')
+            letters = self.alphabet + self.alphabet_lower
+            tables[direction] = str.maketrans({c: func(c) for c in letters})
+        return tables[direction]
+    
+    def _encrypt_numpy(self, text: str) -> str:
+        return self._apply_codes(text, self._encrypt_codes)
+    
+    def _decrypt_numpy(self, text: str) -> str:
+        return self._apply_codes(text, self._decrypt_codes)
+    
+    def _apply_codes(self, text: str, transform) -> str:
+        """Terapkan transformasi kode huruf (0-25) pada teks ASCII secara vektor"""
+        data = np.frombuffer(text.encode('ascii'), dtype=np.uint8).copy()
+        
+        # Ubah huruf kecil menjadi huruf besar
+        data[(data >= 97) & (data <= 122)] -= 32
+        mask = (data >= 65) & (data <= 90)
+        if not mask.any():
+            return text
+        
+        codes = data[mask].astype(np.int64) - 65
+        data[mask] = transform(codes) + 65
+        return data.tobytes().decode('ascii')
+    
+    def _encrypt_process(self, text: str) -> str:
+        return self._run_processes('encrypt', text)
+    
+    def _decrypt_process(self, text: str) -> str:
+        return self._run_processes('decrypt', text)
+    
+    def _run_processes(self, direction: str, text: str) -> str:
+        """Bagi teks per blok lengkap dan proses paralel di beberapa process"""
+        workers = os.cpu_count() or 1
+        piece_size = max(1, -(-len(text) // workers))
+        pieces = list(self._process_stream(
+            (text[i:i + piece_size] for i in range(0, len(text), piece_size)), lambda piece: piece
+        ))
+        
+        pool = _get_process_pool()
+        results = pool.map(_run_in_process, [self] * len(pieces), [direction] * len(pieces), pieces)
+        return ''.join(results)
     
     def clean_text(self, text: str, keep_spaces: bool = False) -> str:
         """Membersihkan teks, hanya menyisakan huruf alfabet"""
@@ -34,50 +244,107 @@ class BaseCipher:
         
         return ''.join(result)
     
+    def stream_block_size(self) -> int:
+        """Jumlah huruf per blok yang harus diproses bersama saat streaming"""
+        return 1
+    
+    def encrypt_stream(self, chunks):
+        """Enkripsi teks yang datang per potongan, hasil juga per potongan"""
+        return self._process_stream(chunks, self.encrypt)
+    
+    def decrypt_stream(self, chunks):
+        """Dekripsi teks yang datang per potongan, hasil juga per potongan"""
+        return self._process_stream(chunks, self.decrypt)
+    
+    def _process_stream(self, chunks, func):
+        # Potongan selalu dipotong setelah blok huruf lengkap terakhir,
+        # sehingga setiap potongan dimulai dari awal blok / awal kunci
+        block_size = self.stream_block_size()
+        pieces = []   # teks yang belum membentuk blok lengkap
+        letters = 0   # jumlah huruf di pieces
+        
+        for chunk in chunks:
+            chunk = chunk.upper()
+            # Hanya potongan baru yang dihitung, teks yang ditahan tidak di-scan ulang
+            letters += sum(map(str.isalpha, chunk))
+            if letters < block_size:
+                pieces.append(chunk)
+                continue
+            
+            # Blok lengkap terakhir pasti berakhir di potongan baru
+            cut = self._block_boundary(chunk, letters % block_size)
+            pieces.append(chunk[:cut])
+            yield func(''.join(pieces))
+            pieces = [chunk[cut:]]
+            letters %= block_size
+        
+        tail = ''.join(pieces)
+        if tail:
+            yield func(tail)
+    
+    def _block_boundary(self, text: str, remainder: int) -> int:
+        """Posisi sebelum remainder huruf terakhir dalam teks"""
+        if remainder == 0:
+            return len(text)
+        
+        # Mundur dari akhir sampai melewati huruf sisa yang belum lengkap
+        for i in range(len(text) - 1, -1, -1):
+            if text[i].isalpha():
+                remainder -= 1
+                if remainder == 0:
+                    return i
+        return 0
+    
+    def encrypt_bytes_stream(self, chunks):
+        """Enkripsi data bytes yang datang per potongan"""
+        for chunk in chunks:
+            yield self.encrypt_bytes(chunk)
+    
+    def decrypt_bytes_stream(self, chunks):
+        """Dekripsi data bytes yang datang per potongan"""
+        for chunk in chunks:
+            yield self.decrypt_bytes(chunk)
+    
+    def _byte_table(self, direction: str) -> bytes:
+        """Tabel 256 entri hasil enkripsi/dekripsi setiap nilai byte"""
+        tables = self.__dict__.setdefault('_byte_tables', {})
+        if direction not in tables:
+            func = getattr(self, f'_{direction}_scalar')
+            table = bytearray(range(256))
+            
+            for byte_val in range(256):
+                # Proses setiap byte sebagai karakter
+                result = func(chr(byte_val))
+                # Ambil karakter pertama jika hasil lebih dari 1 karakter
+                if len(result) > 0:
+                    table[byte_val] = ord(result[0]) % 256
+            
+            tables[direction] = bytes(table)
+        return tables[direction]
+    
     def encrypt_bytes(self, data: bytes) -> bytes:
         """Enkripsi data bytes"""
-        # Konversi bytes ke list of integers
-        byte_list = list(data)
-        encrypted_bytes = []
-        
-        for byte_val in byte_list:
-            # Enkripsi setiap byte sebagai karakter
-            char = chr(byte_val)
-            encrypted_char = self.encrypt(char)
-            # Ambil karakter pertama jika hasil enkripsi lebih dari 1 karakter
-            if len(encrypted_char) > 0:
-                encrypted_bytes.append(ord(encrypted_char[0]) % 256)
-            else:
-                encrypted_bytes.append(byte_val)
-        
-        return bytes(encrypted_bytes)
+        # Setiap byte diproses independen, jadi cukup satu kali translate
+        return bytes(data.translate(self._byte_table('encrypt')))
     
     def decrypt_bytes(self, data: bytes) -> bytes:
         """Dekripsi data bytes"""
-        # Konversi bytes ke list of integers
-        byte_list = list(data)
-        decrypted_bytes = []
-        
-        for byte_val in byte_list:
-            # Dekripsi setiap byte sebagai karakter
-            char = chr(byte_val)
-            decrypted_char = self.decrypt(char)
-            # Ambil karakter pertama jika hasil dekripsi lebih dari 1 karakter
-            if len(decrypted_char) > 0:
-                decrypted_bytes.append(ord(decrypted_char[0]) % 256)
-            else:
-                decrypted_bytes.append(byte_val)
-        
-        return bytes(decrypted_bytes)
+        return bytes(data.translate(self._byte_table('decrypt')))
 
 class ShiftCipher(BaseCipher):
     """Implementasi Shift Cipher (Caesar Cipher)"""
     
+    name = 'shift'
+    engines = ('scalar', 'translate', 'process')
+    
     def __init__(self, shift: int = 3):
         super().__init__()
         self.shift = shift % 26
     
-    def encrypt(self, text: str) -> str:
+    def normalized_key(self) -> str:
+        return str(self.shift)
+    
+    def _encrypt_scalar(self, text: str) -> str:
         """Enkripsi teks menggunakan shift cipher"""
         result = []
         
@@ -93,7 +360,7 @@ class ShiftCipher(BaseCipher):
         
         return ''.join(result)
     
-    def decrypt(self, text: str) -> str:
+    def _decrypt_scalar(self, text: str) -> str:
         """Dekripsi teks menggunakan shift cipher"""
         result = []
         
@@ -112,19 +379,27 @@ class ShiftCipher(BaseCipher):
 class SubstitutionCipher(BaseCipher):
     """Implementasi Substitution Cipher"""
     
+    name = 'substitution'
+    engines = ('scalar', 'translate', 'process')
+    
     def __init__(self, key: str = ""):
         super().__init__()
         if key:
             self.key = self.clean_text(key)
         else:
-            # Generate random key jika tidak ada
-            self.key = ''.join(random.sample(self.alphabet, 26))
+            # Generate random key jika tidak ada (keygen memakai NumPy, di-import saat perlu)
+            from keygen import generate_key
+            self.key = generate_key('substitution')
+            self.deterministic = False
         
         # Buat mapping untuk enkripsi dan dekripsi
         self.encrypt_map = {self.alphabet[i]: self.key[i] for i in range(26)}
         self.decrypt_map = {self.key[i]: self.alphabet[i] for i in range(26)}
     
-    def encrypt(self, text: str) -> str:
+    def normalized_key(self) -> str:
+        return self.key[:26]
+    
+    def _encrypt_scalar(self, text: str) -> str:
         """Enkripsi teks menggunakan substitution cipher"""
         result = []
         
@@ -136,7 +411,7 @@ class SubstitutionCipher(BaseCipher):
         
         return ''.join(result)
     
-    def decrypt(self, text: str) -> str:
+    def _decrypt_scalar(self, text: str) -> str:
         """Dekripsi teks menggunakan substitution cipher"""
         result = []
         
@@ -151,6 +426,9 @@ class SubstitutionCipher(BaseCipher):
 class AffineCipher(BaseCipher):
     """Implementasi Affine Cipher"""
     
+    name = 'affine'
+    engines = ('scalar', 'translate', 'process')
+    
     def __init__(self, a: int = 1, b: int = 0):
         super().__init__()
         self.a = a % 26
@@ -163,6 +441,9 @@ class AffineCipher(BaseCipher):
         # Hitung modular inverse dari a
         self.a_inv = self.mod_inverse(self.a, 26)
     
+    def normalized_key(self) -> str:
+        return f"{self.a},{self.b}"
+    
     def gcd(self, a: int, b: int) -> int:
         """Menghitung Greatest Common Divisor"""
         while b:
@@ -176,7 +457,7 @@ class AffineCipher(BaseCipher):
                 return i
         return 1
     
-    def encrypt(self, text: str) -> str:
+    def _encrypt_scalar(self, text: str) -> str:
         """Enkripsi teks menggunakan affine cipher"""
         result = []
         
@@ -190,7 +471,7 @@ class AffineCipher(BaseCipher):
         
         return ''.join(result)
     
-    def decrypt(self, text: str) -> str:
+    def _decrypt_scalar(self, text: str) -> str:
         """Dekripsi teks menggunakan affine cipher"""
         result = []
         
@@ -207,13 +488,57 @@ class AffineCipher(BaseCipher):
 class VigenereCipher(BaseCipher):
     """Implementasi Vigenere Cipher"""
     
+    name = 'vigenere'
+    engines = ('scalar', 'numpy', 'process')
+    
     def __init__(self, key: str = ""):
         super().__init__()
         self.key = self.clean_text(key)
         if not self.key:
             self.key = "KEY"
     
-    def encrypt(self, text: str) -> str:
+    def normalized_key(self) -> str:
+        return self.key
+    
+    def stream_block_size(self) -> int:
+        """Potongan stream harus sejajar dengan panjang kunci"""
+        return len(self.key)
+    
+    def encrypt_stream(self, chunks):
+        return self._keyed_stream(chunks, 'encrypt')
+    
+    def decrypt_stream(self, chunks):
+        return self._keyed_stream(chunks, 'decrypt')
+    
+    def _keyed_stream(self, chunks, direction: str):
+        """
+        Stream tanpa menahan teks: posisi kunci dibawa antar potongan dengan
+        memakai kunci yang dirotasi, sehingga teks dengan huruf yang jarang
+        tidak menumpuk di buffer
+        """
+        rotated = {}
+        offset = 0
+        
+        for chunk in chunks:
+            chunk = chunk.upper()
+            cipher = rotated.get(offset)
+            if cipher is None:
+                cipher = rotated[offset] = VigenereCipher(self.key[offset:] + self.key[:offset])
+            yield getattr(cipher, direction)(chunk)
+            offset = (offset + sum(map(str.isalpha, chunk))) % len(self.key)
+    
+    def _key_codes(self, length: int) -> np.ndarray:
+        """Kode kunci yang diulang sepanjang length"""
+        key_codes = np.array([ord(c) - ord('A') for c in self.key], dtype=np.int64)
+        return np.resize(key_codes, length)
+    
+    def _encrypt_codes(self, codes: np.ndarray) -> np.ndarray:
+        return (codes + self._key_codes(len(codes))) % 26
+    
+    def _decrypt_codes(self, codes: np.ndarray) -> np.ndarray:
+        return (codes - self._key_codes(len(codes))) % 26
+    
+    def _encrypt_scalar(self, text: str) -> str:
         """Enkripsi teks menggunakan vigenere cipher"""
         result = []
         key_index = 0
@@ -230,7 +555,7 @@ class VigenereCipher(BaseCipher):
         
         return ''.join(result)
     
-    def decrypt(self, text: str) -> str:
+    def _decrypt_scalar(self, text: str) -> str:
         """Dekripsi teks menggunakan vigenere cipher"""
         result = []
         key_index = 0
@@ -250,11 +575,34 @@ class VigenereCipher(BaseCipher):
 class HillCipher(BaseCipher):
     """Implementasi Hill Cipher"""
     
+    name = 'hill'
+    engines = ('scalar', 'numpy', 'process')
+    
     def __init__(self, key: str = ""):
         super().__init__()
         self.key_matrix = self.parse_key(key)
         self.key_matrix_inv = self.calculate_inverse(self.key_matrix)
     
+    def normalized_key(self) -> str:
+        return ','.join(str(int(x)) for x in self.key_matrix.ravel())
+    
+    def stream_block_size(self) -> int:
+        """Potongan stream harus sejajar dengan ukuran matrix"""
+        return self.key_matrix.shape[0]
+    
+    def _encrypt_codes(self, codes: np.ndarray) -> np.ndarray:
+        return self._multiply_blocks(codes, self.key_matrix)
+    
+    def _decrypt_codes(self, codes: np.ndarray) -> np.ndarray:
+        return self._multiply_blocks(codes, self.key_matrix_inv)
+    
+    def _multiply_blocks(self, codes: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+        """Kalikan semua blok sekaligus, padding 'X' dibuang dari hasil"""
+        n = matrix.shape[0]
+        padded = np.concatenate([codes, np.full(-len(codes) % n, ord('X') - ord('A'))])
+        blocks = padded.reshape(-1, n)
+        return ((blocks @ matrix.T) % 26).ravel()[:len(codes)]
+    
     def parse_key(self, key: str) -> np.ndarray:
         """Parse key string menjadi matrix"""
         cleaned_key = self.clean_text(key)
@@ -283,19 +631,8 @@ class HillCipher(BaseCipher):
         return matrix
     
     def calculate_inverse(self, matrix: np.ndarray) -> np.ndarray:
-        """Hitung inverse matrix modulo 26"""
-        det = int(round(np.linalg.det(matrix))) % 26
-        
-        # Hitung modular inverse dari determinant
-        det_inv = self.mod_inverse(det, 26)
-        
-        # Hitung adjugate matrix
-        adj = np.round(np.linalg.inv(matrix) * np.linalg.det(matrix)).astype(int) % 26
-        
-        # Hitung inverse matrix
-        matrix_inv = (det_inv * adj) % 26
-        
-        return matrix_inv
+        """Hitung inverse matrix modulo 26 (ValueError jika tidak invertible)"""
+        return self.inverse_mod(matrix, 26)
     
     def mod_inverse(self, a: int, m: int) -> int:
         """Hitung modular inverse"""
@@ -304,7 +641,138 @@ class HillCipher(BaseCipher):
                 return i
         return 1
     
-    def encrypt(self, text: str) -> str:
+    def integer_determinant(self, matrix) -> int:
+        """Hitung determinant secara eksak (algoritma Bareiss, tanpa float)"""
+        m = [[int(x) for x in row] for row in matrix]
+        n = len(m)
+        sign = 1
+        prev = 1
+        
+        for k in range(n - 1):
+            # Cari pivot tidak nol
+            if m[k][k] == 0:
+                for i in range(k + 1, n):
+                    if m[i][k] != 0:
+                        m[k], m[i] = m[i], m[k]
+                        sign = -sign
+                        break
+                else:
+                    return 0
+            
+            for i in range(k + 1, n):
+                for j in range(k + 1, n):
+                    m[i][j] = (m[i][j] * m[k][k] - m[i][k] * m[k][j]) // prev
+            prev = m[k][k]
+        
+        return sign * m[n - 1][n - 1] if n else 1
+    
+    def inverse_mod(self, matrix: np.ndarray, modulus: int) -> np.ndarray:
+        """Hitung inverse matrix modulo modulus dengan aritmetika integer eksak"""
+        n = matrix.shape[0]
+        det = self.integer_determinant(matrix) % modulus
+        
+        try:
+            det_inv = pow(det, -1, modulus)
+        except ValueError:
+            raise ValueError(f"Matriks kunci tidak invertible modulo {modulus}")
+        
+        if n == 1:
+            return np.array([[det_inv]], dtype=np.int64)
+        
+        # Adjugate = transpose dari matrix kofaktor
+        adj = np.zeros((n, n), dtype=np.int64)
+        for i in range(n):
+            for j in range(n):
+                minor = np.delete(np.delete(matrix, i, axis=0), j, axis=1)
+                cofactor = (-1) ** (i + j) * self.integer_determinant(minor)
+                adj[j][i] = cofactor % modulus
+        
+        return (det_inv * adj) % modulus
+    
+    @property
+    def byte_block_size(self) -> int:
+        """Jumlah byte per blok pada mode biner"""
+        return self.key_matrix.shape[0]
+    
+    def _byte_matrices(self):
+        """Matrix kunci dan inverse-nya modulo 256 (di-cache)"""
+        if '_byte_key' not in self.__dict__:
+            if self.integer_determinant(self.key_matrix) % 2 == 0:
+                raise ValueError("Determinan matriks kunci harus ganjil untuk enkripsi file (mod 256)")
+            # uint16: hasil perkalian overflow mod 65536, tetap benar mod 256
+            self._byte_key = self.key_matrix.astype(np.uint16)
+            self._byte_key_inv = self.inverse_mod(self.key_matrix, 256).astype(np.uint16)
+        return self._byte_key, self._byte_key_inv
+    
+    def _transform_blocks(self, data: bytes, matrix: np.ndarray) -> bytes:
+        """Kalikan data (panjang kelipatan n) dengan matrix per batch besar"""
+        n = matrix.shape[0]
+        batch = max(n, HILL_BYTE_BATCH - HILL_BYTE_BATCH % n)
+        view = memoryview(data)
+        parts = []
+        
+        for start in range(0, len(view), batch):
+            blocks = np.frombuffer(view[start:start + batch], dtype=np.uint8).reshape(-1, n)
+            product = blocks.astype(np.uint16) @ matrix.T
+            parts.append(product.astype(np.uint8).tobytes())
+        
+        return b''.join(parts)
+    
+    def encrypt_bytes(self, data: bytes) -> bytes:
+        """Enkripsi data bytes sebagai blok Hill modulo 256"""
+        key, _ = self._byte_matrices()
+        n = key.shape[0]
+        
+        # Padding gaya PKCS#7: 1..n byte bernilai panjang padding
+        pad = n - len(data) % n
+        return self._transform_blocks(bytes(data) + bytes([pad]) * pad, key)
+    
+    def decrypt_bytes(self, data: bytes) -> bytes:
+        """Dekripsi data bytes dan buang padding"""
+        _, key_inv = self._byte_matrices()
+        n = key_inv.shape[0]
+        
+        if len(data) == 0 or len(data) % n != 0:
+            raise ValueError(f"Panjang data harus kelipatan {n} untuk dekripsi Hill")
+        
+        decrypted = self._transform_blocks(data, key_inv)
+        pad = decrypted[-1]
+        if not 1 <= pad <= n or decrypted[-pad:] != bytes([pad]) * pad:
+            raise ValueError("Padding tidak valid, kunci mungkin salah")
+        return decrypted[:-pad]
+    
+    def encrypt_bytes_stream(self, chunks):
+        """Enkripsi stream bytes, padding hanya di akhir stream"""
+        key, _ = self._byte_matrices()
+        n = key.shape[0]
+        pending = b''
+        
+        for chunk in chunks:
+            pending += chunk
+            cut = len(pending) - len(pending) % n
+            if cut:
+                yield self._transform_blocks(pending[:cut], key)
+                pending = pending[cut:]
+        
+        yield self.encrypt_bytes(pending)
+    
+    def decrypt_bytes_stream(self, chunks):
+        """Dekripsi stream bytes, blok terakhir ditahan untuk membuang padding"""
+        _, key_inv = self._byte_matrices()
+        n = key_inv.shape[0]
+        pending = b''
+        
+        for chunk in chunks:
+            pending += chunk
+            # Sisakan minimal satu blok karena bisa jadi blok terakhir
+            cut = len(pending) - len(pending) % n - n
+            if cut > 0:
+                yield self._transform_blocks(pending[:cut], key_inv)
+                pending = pending[cut:]
+        
+        yield self.decrypt_bytes(pending)
+    
+    def _encrypt_scalar(self, text: str) -> str:
         """Enkripsi teks menggunakan hill cipher"""
         result = []
         matrix_size = self.key_matrix.shape[0]
@@ -346,7 +814,7 @@ class HillCipher(BaseCipher):
         
         return ''.join(final_result)
     
-    def decrypt(self, text: str) -> str:
+    def _decrypt_scalar(self, text: str) -> str:
         """Dekripsi teks menggunakan hill cipher"""
         # Hanya proses karakter alfabet, abaikan yang lain
         alpha_chars = []
@@ -395,11 +863,36 @@ class HillCipher(BaseCipher):
 class PermutationCipher(BaseCipher):
     """Implementasi Permutation Cipher"""
     
+    name = 'permutation'
+    engines = ('scalar', 'numpy', 'process')
+    
     def __init__(self, key: str = ""):
         super().__init__()
         self.permutation = self.parse_permutation(key)
         self.inverse_permutation = self.calculate_inverse_permutation(self.permutation)
     
+    def normalized_key(self) -> str:
+        return ','.join(str(x) for x in self.permutation)
+    
+    def stream_block_size(self) -> int:
+        """Potongan stream harus sejajar dengan panjang permutasi"""
+        return len(self.permutation)
+    
+    def _encrypt_codes(self, codes: np.ndarray) -> np.ndarray:
+        return self._permute_blocks(codes, self.permutation)
+    
+    def _decrypt_codes(self, codes: np.ndarray) -> np.ndarray:
+        return self._permute_blocks(codes, self.inverse_permutation)
+    
+    def _permute_blocks(self, codes: np.ndarray, permutation: List[int]) -> np.ndarray:
+        """Permutasi semua blok sekaligus, padding 'X' dibuang dari hasil"""
+        n = len(permutation)
+        padded = np.concatenate([codes, np.full(-len(codes) % n, ord('X') - ord('A'))])
+        blocks = padded.reshape(-1, n)
+        permuted = np.empty_like(blocks)
+        permuted[:, permutation] = blocks
+        return permuted.ravel()[:len(codes)]
+    
     def parse_permutation(self, key: str) -> List[int]:
         """Parse key string menjadi permutation"""
         if not key:
@@ -431,7 +924,7 @@ class PermutationCipher(BaseCipher):
             inverse[permutation[i]] = i
         return inverse
     
-    def encrypt(self, text: str) -> str:
+    def _encrypt_scalar(self, text: str) -> str:
         """Enkripsi teks menggunakan permutation cipher"""
         # Hanya proses karakter alfabet, abaikan yang lain
         alpha_chars = []
@@ -473,7 +966,7 @@ class PermutationCipher(BaseCipher):
         
         return ''.join(final_result)
     
-    def decrypt(self, text: str) -> str:
+    def _decrypt_scalar(self, text: str) -> str:
         """Dekripsi teks menggunakan permutation cipher"""
         # Hanya proses karakter alfabet, abaikan yang lain
         alpha_chars = []
@@ -0,0 +1,301 @@
+"""
+Format kontainer biner untuk file terenkripsi
+
+Struktur file:
+    [header][nama cipher][payload chunk 0][payload chunk 1]...[index]
+
+Header menyimpan tipe cipher, fingerprint kunci, panjang asli file, ukuran
+chunk dan posisi index. Fingerprint dihitung dari bentuk kanonik kunci
+(kunci yang ekuivalen, misalnya 'key' dan 'KEY', menghasilkan fingerprint
+yang sama) dengan PBKDF2 dan salt acak per file, sehingga header tidak bisa
+dipakai untuk menebak kunci secara cepat. Index berisi satu entri per chunk (offset, panjang
+terenkripsi, panjang asli, fase kunci, CRC32) sehingga pembaca dapat
+mendekripsi rentang byte mana pun tanpa memproses bagian sebelumnya.
+"""
+
+import hashlib
+import hmac
+import mmap
+import os
+import struct
+import zlib
+from collections import namedtuple
+
+from registry import create_cipher
+
+MAGIC = b'KRPT'
+VERSION = 1
+DEFAULT_CHUNK_SIZE = 1024 * 1024  # 1MB per chunk
+
+# magic, versi, flags, panjang nama cipher, panjang asli, ukuran chunk,
+# jumlah chunk, offset index, fingerprint kunci, salt fingerprint
+HEADER_STRUCT = struct.Struct('<4sBBHQIIQ8s16s')
+
+SALT_SIZE = 16
+FINGERPRINT_ITERATIONS = 50000
+# offset payload, panjang terenkripsi, panjang asli, fase kunci, crc32
+INDEX_STRUCT = struct.Struct('<QIIII')
+
+ChunkEntry = namedtuple('ChunkEntry', 'offset length plain_length key_phase checksum')
+
+
+class ContainerError(ValueError):
+    """Error untuk file kontainer yang rusak atau tidak cocok"""
+
+
+def canonical_key(cipher_type: str, key: str) -> str:
+    """Bentuk kanonik kunci (misalnya shift 29 -> '3'), kunci mentah jika cipher tidak mendukung"""
+    try:
+        return create_cipher(cipher_type, key).normalized_key()
+    except (ValueError, NotImplementedError):
+        return key.strip()
+
+
+def key_material(cipher_type: str, key: str) -> bytes:
+    """Tipe cipher dan kunci kanonik sebagai bytes, input semua turunan kunci"""
+    return f'{cipher_type}\0{canonical_key(cipher_type, key)}'.encode('utf-8')
+
+
+def key_digest(cipher_type: str, key: str, salt: bytes) -> bytes:
+    """PBKDF2 32-byte dari kunci kanonik; 8 byte pertamanya adalah fingerprint"""
+    return hashlib.pbkdf2_hmac('sha256', key_material(cipher_type, key), salt, FINGERPRINT_ITERATIONS)
+
+
+def key_fingerprint(cipher_type: str, key: str, salt: bytes) -> bytes:
+    """Menghitung fingerprint 8-byte dari tipe cipher dan kunci kanonik"""
+    return key_digest(cipher_type, key, salt)[:8]
+
+
+def make_key_check(cipher_type: str, key: str) -> tuple:
+    """
+    Salt baru beserta fingerprint-nya, (salt, fingerprint). Bisa dipakai
+    bersama oleh banyak ContainerWriter agar PBKDF2 cukup dihitung sekali.
+    """
+    salt = os.urandom(SALT_SIZE)
+    return salt, key_fingerprint(cipher_type, key, salt)
+
+
+def is_container(data: bytes) -> bool:
+    """Cek apakah data diawali magic kontainer"""
+    return data[:len(MAGIC)] == MAGIC
+
+
+def aligned_chunk_size(cipher, chunk_size: int) -> int:
+    """
+    Ukuran chunk dibulatkan ke kelipatan ukuran blok byte cipher agar setiap
+    chunk dimulai dari fase kunci 0
+    """
+    block = getattr(cipher, 'byte_block_size', 1)
+    return max(block, chunk_size - chunk_size % block)
+
+
+def payload_size(cipher, plain_length: int) -> int:
+    """Panjang payload terenkripsi satu chunk (mode blok menambah padding hingga satu blok)"""
+    block = getattr(cipher, 'byte_block_size', 1)
+    if block == 1:
+        return plain_length
+    return plain_length - plain_length % block + block
+
+
+def pack_header(cipher_type: str, original_length: int, chunk_size: int, chunk_count: int,
+                index_offset: int, fingerprint: bytes, salt: bytes) -> bytes:
+    """Header kontainer diikuti nama cipher"""
+    name = cipher_type.encode('ascii')
+    return HEADER_STRUCT.pack(
+        MAGIC, VERSION, 0, len(name), original_length,
+        chunk_size, chunk_count, index_offset, fingerprint, salt
+    ) + name
+
+
+def pack_index(entries) -> bytes:
+    """Index kontainer, satu entri per chunk"""
+    return b''.join(INDEX_STRUCT.pack(*entry) for entry in entries)
+
+
+def encrypt_chunk(cipher, data: bytes):
+    """Enkripsi satu chunk, mengembalikan (payload, checksum)"""
+    payload = cipher.encrypt_bytes(data)
+    return payload, zlib.crc32(payload)
+
+
+class ContainerWriter:
+    """Menulis data terenkripsi ke dalam format kontainer"""
+
+    def __init__(self, fileobj, cipher_type: str, key: str, cipher,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, key_check: tuple = None):
+        self.fileobj = fileobj
+        self.cipher_type = cipher_type
+        self.cipher = cipher
+        # key_check dari make_key_check, dibuat baru jika tidak diberikan
+        self.salt, self.fingerprint = key_check or make_key_check(cipher_type, key)
+
+        self.chunk_size = aligned_chunk_size(cipher, chunk_size)
+
+        self.entries = []
+        self.original_length = 0
+        self._buffer = bytearray()
+        self._closed = False
+
+        self._start = fileobj.tell()
+        # Tulis header sementara, akan diperbarui saat close()
+        fileobj.write(self._pack_header(0))
+
+    def _pack_header(self, index_offset: int) -> bytes:
+        return pack_header(self.cipher_type, self.original_length, self.chunk_size,
+                           len(self.entries), index_offset, self.fingerprint, self.salt)
+
+    def write(self, data: bytes):
+        """Tambahkan data plaintext, dienkripsi per chunk"""
+        self._buffer.extend(data)
+        while len(self._buffer) >= self.chunk_size:
+            chunk = bytes(self._buffer[:self.chunk_size])
+            del self._buffer[:self.chunk_size]
+            payload, checksum = encrypt_chunk(self.cipher, chunk)
+            self._write_chunk(payload, len(chunk), checksum)
+
+    def append_encrypted(self, payload: bytes, plain_length: int, checksum: int = None):
+        """Tambahkan chunk yang sudah dienkripsi (misalnya oleh worker lain)"""
+        if self._buffer:
+            raise ContainerError('Masih ada data yang belum ditulis ke chunk')
+        self._write_chunk(payload, plain_length, checksum)
+
+    def _check_chunk_order(self):
+        if self.entries and self.entries[-1].plain_length != self.chunk_size:
+            raise ContainerError('Hanya chunk terakhir yang boleh lebih kecil dari ukuran chunk')
+
+    def _write_chunk(self, payload: bytes, plain_length: int, checksum: int = None):
+        self._check_chunk_order()
+        if checksum is None:
+            checksum = zlib.crc32(payload)
+
+        offset = self.fileobj.tell() - self._start
+        self.fileobj.write(payload)
+        self._add_entry(offset, len(payload), plain_length, checksum)
+
+    def _add_entry(self, offset: int, length: int, plain_length: int, checksum: int):
+        key_phase = self.original_length % getattr(self.cipher, 'byte_block_size', 1)
+        self.entries.append(ChunkEntry(offset, length, plain_length, key_phase, checksum))
+        self.original_length += plain_length
+
+    def close(self):
+        """Flush chunk terakhir, tulis index dan perbarui header"""
+        if self._closed:
+            return
+        if self._buffer:
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            payload, checksum = encrypt_chunk(self.cipher, chunk)
+            self._write_chunk(payload, len(chunk), checksum)
+
+        index_offset = self.fileobj.tell() - self._start
+        self.fileobj.write(pack_index(self.entries))
+        end = self.fileobj.tell()
+
+        self.fileobj.seek(self._start)
+        self.fileobj.write(self._pack_header(index_offset))
+        self.fileobj.seek(end)
+        self._closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+
+
+class ContainerReader:
+    """Membaca dan mendekripsi file kontainer secara acak (random access)"""
+
+    def __init__(self, path: str, cipher=None):
+        self.cipher = cipher
+        self._file = open(path, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # File kosong tidak bisa di-mmap
+            self._file.close()
+            raise ContainerError('File kontainer kosong')
+
+        try:
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _parse(self):
+        if len(self._map) < HEADER_STRUCT.size or not is_container(self._map[:len(MAGIC)]):
+            raise ContainerError('Bukan file kontainer yang valid')
+
+        (_, version, _, name_len, self.original_length, self.chunk_size,
+         chunk_count, index_offset, self.fingerprint, self.salt) = HEADER_STRUCT.unpack_from(self._map, 0)
+
+        if version != VERSION:
+            raise ContainerError(f'Versi kontainer tidak didukung: {version}')
+
+        name_start = HEADER_STRUCT.size
+        self.cipher_type = self._map[name_start:name_start + name_len].decode('ascii')
+
+        index_end = index_offset + chunk_count * INDEX_STRUCT.size
+        if index_end > len(self._map):
+            raise ContainerError('Index kontainer terpotong')
+
+        self.chunks = [
+            ChunkEntry(*INDEX_STRUCT.unpack_from(self._map, index_offset + i * INDEX_STRUCT.size))
+            for i in range(chunk_count)
+        ]
+
+    def matches_key(self, cipher_type: str, key: str) -> bool:
+        """Cek apakah tipe cipher dan kunci sesuai dengan header"""
+        if cipher_type != self.cipher_type:
+            return False
+        return hmac.compare_digest(key_fingerprint(cipher_type, key, self.salt), self.fingerprint)
+
+    def read_chunk(self, index: int) -> bytes:
+        """Verifikasi checksum dan dekripsi satu chunk"""
+        entry = self.chunks[index]
+        payload = self._map[entry.offset:entry.offset + entry.length]
+
+        if zlib.crc32(payload) != entry.checksum:
+            raise ContainerError(f'Checksum chunk {index} tidak cocok, file rusak')
+        if entry.key_phase != 0:
+            raise ContainerError(f'Fase kunci chunk {index} tidak didukung')
+
+        # Potong padding agar panjang kembali seperti semula
+        return self.cipher.decrypt_bytes(payload)[:entry.plain_length]
+
+    def read_range(self, start: int, end: int) -> bytes:
+        """Dekripsi rentang byte [start, end) dari data asli"""
+        start = max(0, start)
+        end = min(end, self.original_length)
+        if start >= end:
+            return b''
+
+        first = start // self.chunk_size
+        last = (end - 1) // self.chunk_size
+        parts = [self.read_chunk(i) for i in range(first, last + 1)]
+
+        data = b''.join(parts)
+        offset = first * self.chunk_size
+        return data[start - offset:end - offset]
+
+    def iter_chunks(self):
+        """Dekripsi semua chunk secara berurutan"""
+        for i in range(len(self.chunks)):
+            yield self.read_chunk(i)
+
+    def read_all(self) -> bytes:
+        """Dekripsi seluruh isi kontainer"""
+        return b''.join(self.iter_chunks())
+
+    def close(self):
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
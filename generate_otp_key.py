@@ -4,8 +4,7 @@ Script untuk generate kunci One-Time Pad
 Membuat file berisi huruf-huruf acak untuk digunakan sebagai kunci OTP
 """
 
-import random
-import string
+from keygen import random_letters
 
 def generate_otp_key(length=10000, filename="otp_key.txt"):
     """
@@ -15,8 +14,9 @@ def generate_otp_key(length=10000, filename="otp_key.txt"):
         length (int): Panjang kunci yang diinginkan
         filename (str): Nama file untuk menyimpan kunci
     """
-    # Generate huruf acak
-    key = ''.join(random.choices(string.ascii_uppercase, k=length))
+    # Generate huruf acak dari os.urandom (lihat keygen.py), tanpa batas
+    # panjang kunci Vigenere dari KEY_SIZE_LIMITS
+    key = bytes((random_letters(1, length)[0] + 65).tolist()).decode('ascii')
     
     # Simpan ke file
     with open(filename, 'w') as f:
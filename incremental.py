@@ -0,0 +1,197 @@
+"""
+Enkripsi/dekripsi inkremental untuk mode live-typing
+
+Setiap sesi menyimpan teks input, hasil terakhir dan posisi huruf dalam
+teks. Edit dikirim sebagai (offset, deleted, inserted) dan hanya huruf yang
+terpengaruh yang diproses ulang:
+
+- cipher monoalfabetik: hanya huruf yang diedit
+- Hill / Permutation: blok yang tersentuh edit
+- Vigenere: huruf yang diedit jika jumlah huruf berubah kelipatan panjang
+  kunci, selain itu seluruh sisa teks setelah edit (divektorkan lewat engine)
+
+Hasilnya dikembalikan sebagai diff terhadap hasil sebelumnya.
+"""
+
+import secrets
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+
+def _letter_positions(text: str) -> np.ndarray:
+    """Posisi semua huruf dalam teks"""
+    if text.isascii():
+        data = np.frombuffer(text.encode('ascii'), dtype=np.uint8)
+        upper = data & 0xDF
+        return np.flatnonzero((upper >= 65) & (upper <= 90)).astype(np.int64)
+    return np.array([i for i, c in enumerate(text) if c.isalpha()], dtype=np.int64)
+
+
+def _common_diff(old: str, new: str) -> dict:
+    """Diff sederhana berdasarkan prefix dan suffix yang sama"""
+    limit = min(len(old), len(new))
+    prefix = 0
+    while prefix < limit and old[prefix] == new[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and old[-1 - suffix] == new[-1 - suffix]:
+        suffix += 1
+    return {
+        'offset': prefix,
+        'deleted': len(old) - prefix - suffix,
+        'inserted': new[prefix:len(new) - suffix],
+    }
+
+
+class IncrementalSession:
+    """Sesi enkripsi/dekripsi yang memproses ulang hanya bagian yang berubah"""
+
+    def __init__(self, cipher, direction: str = 'encrypt', text: str = ''):
+        if direction not in ('encrypt', 'decrypt'):
+            raise ValueError(f"Arah tidak valid: {direction}")
+
+        self.cipher = cipher
+        self.direction = direction
+        self.block_size = cipher.stream_block_size()
+        self._func = getattr(cipher, direction)
+        self._reset(text)
+        self.last_used = time.monotonic()
+
+    def _reset(self, text: str):
+        self.text = text
+        self.output = self._func(text)
+        self.positions = _letter_positions(text)
+        # Posisi input dan output hanya sejajar jika panjangnya sama
+        self._aligned = len(self.output) == len(text)
+
+    def apply_edit(self, offset: int, deleted: int, inserted: str) -> dict:
+        """
+        Terapkan satu edit pada teks input
+
+        Args:
+            offset (int): Posisi awal edit
+            deleted (int): Jumlah karakter yang dihapus
+            inserted (str): Teks yang disisipkan
+
+        Returns:
+            dict: diff hasil (offset, deleted, inserted) terhadap hasil sebelumnya
+        """
+        self.last_used = time.monotonic()
+        if offset < 0 or deleted < 0 or offset + deleted > len(self.text):
+            raise ValueError("Edit di luar batas teks")
+
+        new_text = self.text[:offset] + inserted + self.text[offset + deleted:]
+
+        # Karakter yang panjangnya berubah saat di-uppercase (misalnya 'ß')
+        # menggeser posisi output
+        if not self._aligned or len(inserted.upper()) != len(inserted):
+            return self._recompute(new_text)
+
+        # Perbarui posisi huruf
+        delta_chars = len(inserted) - deleted
+        first, after = (int(i) for i in np.searchsorted(self.positions, [offset, offset + deleted]))
+        inserted_positions = _letter_positions(inserted) + offset
+        positions = np.concatenate([
+            self.positions[:first], inserted_positions, self.positions[after:] + delta_chars
+        ])
+
+        # Teks tanpa huruf dikembalikan apa adanya oleh Hill/Permutation,
+        # jadi proses ulang seluruhnya
+        if len(self.positions) == 0 or len(positions) == 0:
+            return self._recompute(new_text)
+
+        # Rentang huruf yang harus diproses ulang, sejajar dengan blok
+        block = self.block_size
+        delta_letters = len(inserted_positions) - (after - first)
+        start = (first // block) * block
+        if delta_letters % block == 0:
+            end = -(-(first + len(inserted_positions)) // block) * block
+        else:
+            end = len(positions)
+        end = min(end, len(positions))
+
+        # Karakter non-huruf cukup di-uppercase, huruf diisi dari hasil cipher
+        output = self.output[:offset] + inserted.upper() + self.output[offset + deleted:]
+        span_start, span_end = offset, offset + len(inserted)
+
+        if start < end:
+            region = positions[start:end]
+            if new_text.isascii():
+                source = np.frombuffer(new_text.encode('ascii'), dtype=np.uint8)
+                letters = source[region].tobytes().decode('ascii')
+            else:
+                letters = ''.join(new_text[p] for p in region)
+
+            processed = self._func(letters)
+            span_start = min(span_start, int(region[0]))
+            span_end = max(span_end, int(region[-1]) + 1)
+
+            piece = output[span_start:span_end]
+            if piece.isascii() and processed.isascii():
+                buffer = np.frombuffer(piece.encode('ascii'), dtype=np.uint8).copy()
+                buffer[region - span_start] = np.frombuffer(processed.encode('ascii'), dtype=np.uint8)
+                piece = buffer.tobytes().decode('ascii')
+            else:
+                chars = list(piece)
+                for pos, char in zip(region.tolist(), processed):
+                    chars[pos - span_start] = char
+                piece = ''.join(chars)
+            output = output[:span_start] + piece + output[span_end:]
+
+        self.text = new_text
+        self.output = output
+        self.positions = positions
+
+        return {
+            'offset': span_start,
+            'deleted': span_end - delta_chars - span_start,
+            'inserted': output[span_start:span_end],
+        }
+
+    def _recompute(self, new_text: str) -> dict:
+        """Proses ulang seluruh teks, diff dihitung dari prefix/suffix"""
+        old_output = self.output
+        self._reset(new_text)
+        return _common_diff(old_output, self.output)
+
+
+class SessionStore:
+    """Penyimpanan sesi inkremental dengan batas jumlah dan masa berlaku"""
+
+    def __init__(self, max_sessions: int = 256, ttl: float = 30 * 60):
+        self.max_sessions = max_sessions
+        self.ttl = ttl
+        self._sessions = OrderedDict()
+        self._lock = threading.Lock()
+
+    def create(self, cipher, direction: str, text: str):
+        """Buat sesi baru, mengembalikan (session_id, session)"""
+        session = IncrementalSession(cipher, direction, text)
+        session_id = secrets.token_urlsafe(16)
+        with self._lock:
+            self._expire()
+            self._sessions[session_id] = session
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+        return session_id, session
+
+    def get(self, session_id: str):
+        """Ambil sesi, None jika tidak ada atau sudah kadaluarsa"""
+        with self._lock:
+            self._expire()
+            session = self._sessions.get(session_id)
+            if session is not None:
+                self._sessions.move_to_end(session_id)
+            return session
+
+    def remove(self, session_id: str):
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    def _expire(self):
+        now = time.monotonic()
+        for session_id in [sid for sid, s in self._sessions.items() if now - s.last_used > self.ttl]:
+            del self._sessions[session_id]
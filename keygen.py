@@ -0,0 +1,279 @@
+"""
+Pembangkitan kunci acak secara massal untuk semua tipe cipher
+
+Semua bilangan acak berasal dari secrets (os.urandom), bukan dari modul
+random. Byte acak diubah menjadi bilangan [0, batas) dengan rejection
+sampling agar distribusinya seragam, dan semuanya dikerjakan per batch
+dengan NumPy:
+
+- Hill: matriks acak dibangkitkan per batch lalu disaring dengan eliminasi
+  Gauss mod 2 dan mod 13 (kunci invertible mod 26 jika determinannya tidak
+  habis dibagi 2 maupun 13). Determinan ganjil juga berarti kunci bisa
+  dipakai untuk enkripsi file (mod 256).
+- Substitution dan Permutation: Fisher-Yates yang divektorisasi, satu
+  langkah swap untuk semua permutasi dalam batch sekaligus.
+- Shift, Affine dan Vigenere: langsung dari bilangan acak seragam; kunci
+  identitas (geseran 0, Affine 1,0, Vigenere 'AAA...') tidak pernah dihasilkan.
+
+KeyPool menyimpan stok kunci yang sudah dibangkitkan dan mengisinya ulang
+di thread latar belakang, sehingga request hanya mengambil dari stok.
+"""
+
+import secrets
+import threading
+from collections import deque
+
+import numpy as np
+
+KEY_TYPES = ('shift', 'substitution', 'affine', 'vigenere', 'hill', 'permutation')
+
+# Ukuran default: panjang kunci Vigenere, ukuran matriks Hill, panjang blok Permutation
+DEFAULT_KEY_SIZES = {
+    'vigenere': 12,
+    'hill': 3,
+    'permutation': 5,
+}
+KEY_SIZE_LIMITS = {
+    'vigenere': (1, 100000),
+    'hill': (1, 10),
+    'permutation': (2, 1000),
+}
+
+# Nilai a yang coprime dengan 26 untuk Affine
+AFFINE_MULTIPLIERS = np.array([1, 3, 5, 7, 9, 11, 15, 17, 19, 21, 23, 25])
+
+# Minimal ~26% matriks acak invertible mod 26 (untuk semua ukuran)
+HILL_OVERSAMPLE = 4
+
+
+def random_below(bounds, shape) -> np.ndarray:
+    """
+    Bilangan acak seragam di [0, bounds) dari os.urandom
+
+    Args:
+        bounds: Batas atas (eksklusif), skalar atau array yang bisa di-broadcast ke shape
+        shape: Bentuk array hasil
+
+    Returns:
+        np.ndarray: Array int64 berbentuk shape
+    """
+    bounds = np.broadcast_to(np.asarray(bounds, dtype=np.uint64), shape).ravel()
+    # Nilai uint32 di atas kelipatan terbesar batas ditolak agar tidak bias
+    limits = (2 ** 32 // bounds) * bounds
+    result = np.empty(len(bounds), dtype=np.int64)
+    pending = np.arange(len(bounds))
+
+    while len(pending):
+        raw = np.frombuffer(secrets.token_bytes(4 * len(pending)), dtype=np.uint32).astype(np.uint64)
+        accepted = raw < limits[pending]
+        index = pending[accepted]
+        result[index] = raw[accepted] % bounds[index]
+        pending = pending[~accepted]
+
+    return result.reshape(shape)
+
+
+def random_letters(count: int, length: int) -> np.ndarray:
+    """Kode huruf 0-25 acak berbentuk (count, length)"""
+    return random_below(26, (count, length))
+
+
+def random_permutations(count: int, n: int) -> np.ndarray:
+    """count permutasi acak dari range(n) dengan Fisher-Yates per batch"""
+    permutations = np.tile(np.arange(n), (count, 1))
+    if n < 2 or count == 0:
+        return permutations
+
+    rows = np.arange(count)
+    # Kolom ke-s: indeks tukar untuk posisi i = n-1-s, seragam di [0, i]
+    swaps = random_below(np.arange(n, 1, -1), (count, n - 1))
+    for step, i in enumerate(range(n - 1, 0, -1)):
+        j = swaps[:, step]
+        current = permutations[:, i].copy()
+        permutations[:, i] = permutations[rows, j]
+        permutations[rows, j] = current
+    return permutations
+
+
+def _full_rank_mod(matrices: np.ndarray, p: int) -> np.ndarray:
+    """Mask matriks (batch x n x n) yang invertible modulo bilangan prima p"""
+    m = matrices % p
+    count, n, _ = m.shape
+    rows = np.arange(count)
+    inverses = np.array([0] + [pow(x, -1, p) for x in range(1, p)])
+    invertible = np.ones(count, dtype=bool)
+
+    for k in range(n):
+        nonzero = m[:, k:, k] != 0
+        invertible &= nonzero.any(axis=1)
+
+        # Tukar baris pivot ke posisi k (matriks tanpa pivot sudah ditandai)
+        pivot = k + nonzero.argmax(axis=1)
+        pivot_rows = m[rows, pivot].copy()
+        m[rows, pivot] = m[:, k].copy()
+        m[:, k] = pivot_rows
+
+        # Normalisasi pivot menjadi 1 lalu nolkan kolom k di baris bawahnya
+        m[:, k] = m[:, k] * inverses[m[:, k, k]][:, None] % p
+        factors = m[:, k + 1:, k]
+        m[:, k + 1:] = (m[:, k + 1:] - factors[:, :, None] * m[:, None, k]) % p
+
+    return invertible
+
+
+def invertible_hill_matrices(count: int, n: int = 3) -> np.ndarray:
+    """count matriks n x n acak yang invertible modulo 26"""
+    found = []
+    total = 0
+    while total < count:
+        candidates = random_below(26, (max(64, (count - total) * HILL_OVERSAMPLE), n, n))
+        mask = _full_rank_mod(candidates, 2) & _full_rank_mod(candidates, 13)
+        found.append(candidates[mask])
+        total += int(mask.sum())
+    return np.concatenate(found)[:count]
+
+
+def _letters_to_strings(codes: np.ndarray) -> list:
+    """Baris kode 0-25 menjadi string huruf kapital"""
+    width = codes.shape[1]
+    data = (codes + 65).astype(np.uint8).tobytes()
+    return [data[i:i + width].decode('ascii') for i in range(0, len(data), width)]
+
+
+def _key_size(cipher_type: str, size) -> int:
+    if size is None:
+        return DEFAULT_KEY_SIZES[cipher_type]
+    low, high = KEY_SIZE_LIMITS[cipher_type]
+    if not low <= size <= high:
+        raise ValueError(f"Ukuran kunci {cipher_type} harus antara {low} dan {high}")
+    return size
+
+
+def key_letters(cipher_type: str, count: int = 1, size: int = None) -> int:
+    """Jumlah total huruf/angka kunci dari count kunci, dasar batas biaya /keygen"""
+    if cipher_type not in KEY_TYPES:
+        raise ValueError(f"Tipe cipher tidak valid: {cipher_type}")
+    if cipher_type in ('shift', 'affine'):
+        return count * 2
+    if cipher_type == 'substitution':
+        return count * 26
+    size = _key_size(cipher_type, size)
+    return count * (size * size if cipher_type == 'hill' else size)
+
+
+def generate_keys(cipher_type: str, count: int = 1, size: int = None) -> list:
+    """
+    Bangkitkan count kunci acak dalam format yang diterima create_cipher
+
+    Args:
+        cipher_type (str): Tipe cipher (lihat KEY_TYPES)
+        count (int): Jumlah kunci
+        size (int): Panjang kunci Vigenere, ukuran matriks Hill atau panjang
+            blok Permutation (default DEFAULT_KEY_SIZES); diabaikan untuk cipher lain
+
+    Returns:
+        list: Daftar kunci berupa string
+    """
+    if cipher_type not in KEY_TYPES:
+        raise ValueError(f"Tipe cipher tidak valid: {cipher_type}")
+    if count < 0:
+        raise ValueError("Jumlah kunci tidak boleh negatif")
+
+    if cipher_type == 'shift':
+        # Geseran 0 tidak mengubah teks
+        return [str(shift) for shift in (1 + random_below(25, count)).tolist()]
+
+    if cipher_type == 'affine':
+        a = AFFINE_MULTIPLIERS[random_below(len(AFFINE_MULTIPLIERS), count)]
+        # a = 1 dengan b = 0 adalah kunci identitas
+        b = np.where(a == 1, 1 + random_below(25, count), random_below(26, count))
+        return [f"{x},{y}" for x, y in zip(a.tolist(), b.tolist())]
+
+    if cipher_type == 'substitution':
+        return _letters_to_strings(random_permutations(count, 26))
+
+    size = _key_size(cipher_type, size)
+    if cipher_type == 'vigenere':
+        codes = random_letters(count, size)
+        # Kunci yang semuanya 'A' tidak mengubah teks, bangkitkan ulang barisnya
+        identity = ~codes.any(axis=1)
+        while identity.any():
+            codes[identity] = random_letters(int(identity.sum()), size)
+            identity = ~codes.any(axis=1)
+        return _letters_to_strings(codes)
+    if cipher_type == 'hill':
+        return _letters_to_strings(invertible_hill_matrices(count, size).reshape(count, -1))
+    return [','.join(map(str, row)) for row in random_permutations(count, size).tolist()]
+
+
+def generate_key(cipher_type: str, size: int = None) -> str:
+    """Satu kunci acak"""
+    return generate_keys(cipher_type, 1, size)[0]
+
+
+class KeyPool:
+    """Stok kunci acak per tipe cipher yang diisi ulang di thread latar belakang"""
+
+    def __init__(self, pool_size: int = 256, refill_below: int = 64, cipher_types=KEY_TYPES):
+        self.pool_size = pool_size
+        self.refill_below = refill_below
+        self._keys = {cipher_type: deque() for cipher_type in cipher_types}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+        self.served = 0
+        self.generated_inline = 0
+        self.refills = 0
+
+    def start(self):
+        """Mulai thread pengisi (dipanggil otomatis saat take pertama)"""
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='keygen-pool', daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def take(self, cipher_type: str, count: int = 1, size: int = None) -> list:
+        """
+        Ambil count kunci dari stok. Ukuran non-default dan kekurangan stok
+        dibangkitkan langsung, sehingga request tidak pernah menunggu thread pengisi.
+        """
+        if cipher_type not in self._keys or (size is not None and size != DEFAULT_KEY_SIZES.get(cipher_type)):
+            return generate_keys(cipher_type, count, size)
+
+        with self._lock:
+            stock = self._keys[cipher_type]
+            keys = [stock.popleft() for _ in range(min(count, len(stock)))]
+            low = len(stock) < self.refill_below
+            self.served += len(keys)
+            self.generated_inline += count - len(keys)
+
+        if len(keys) < count:
+            keys.extend(generate_keys(cipher_type, count - len(keys)))
+        if low:
+            self.start()
+        return keys
+
+    def _run(self):
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            for cipher_type, stock in self._keys.items():
+                missing = self.pool_size - len(stock)
+                if missing <= 0:
+                    continue
+                # Dibangkitkan di luar lock agar take tidak ikut menunggu
+                keys = generate_keys(cipher_type, missing)
+                with self._lock:
+                    stock.extend(keys)
+                    self.refills += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'stock': {cipher_type: len(stock) for cipher_type, stock in self._keys.items()},
+                'served': self.served,
+                'generated_inline': self.generated_inline,
+                'refills': self.refills,
+            }
@@ -0,0 +1,167 @@
+"""
+Registry cipher dengan lazy loading
+
+Setiap cipher didaftarkan dengan nama, lokasi class ('modul:Class'), parser
+kunci dan dependensi berat yang langsung di-import saat cipher dibuat
+(engine NumPy yang baru di-load untuk input besar tidak dihitung). Modul cipher baru di-import saat cipher
+pertama kali dipakai, sehingga tool CLI dan worker berumur pendek yang
+hanya memakai cipher scalar tidak menanggung waktu import NumPy.
+
+Cipher pihak ketiga dapat mendaftar lewat entry point group
+'kriptosistem.ciphers', yang mengarah ke CipherSpec atau class cipher:
+
+    [project.entry-points."kriptosistem.ciphers"]
+    playfair = "playfair_cipher:PlayfairCipher"
+"""
+
+import importlib
+import logging
+import threading
+
+ENTRY_POINT_GROUP = 'kriptosistem.ciphers'
+
+logger = logging.getLogger(__name__)
+
+
+def parse_shift_key(key: str) -> tuple:
+    """Kunci shift: satu angka, selain itu 0"""
+    return (int(key) if key.isdigit() else 0,)
+
+
+def parse_affine_key(key: str) -> tuple:
+    """Kunci affine: 'a,b', default (1, 0)"""
+    a, b = map(int, key.split(',')) if ',' in key else (1, 0)
+    return (a, b)
+
+
+def parse_text_key(key: str) -> tuple:
+    """Kunci berupa string, diteruskan apa adanya"""
+    return (key,)
+
+
+class CipherSpec:
+    """Deskripsi cipher yang bisa di-load secara lazy"""
+
+    def __init__(self, name: str, target: str, key_parser=parse_text_key,
+                 heavy_deps: tuple = (), description: str = ''):
+        self.name = name
+        self.target = target
+        self.key_parser = key_parser
+        self.heavy_deps = tuple(heavy_deps)
+        self.description = description
+        self._cls = None
+
+    def load(self):
+        """Import modul cipher (sekali) dan kembalikan class-nya"""
+        if self._cls is None:
+            module_name, _, attr = self.target.partition(':')
+            try:
+                target = importlib.import_module(module_name)
+                for name in attr.split('.'):
+                    target = getattr(target, name)
+            except Exception:
+                logger.warning("Gagal memuat cipher %s dari %s", self.name, self.target, exc_info=True)
+                raise
+            if isinstance(target, CipherSpec):
+                # Entry point boleh mengarah ke CipherSpec milik plugin
+                self.key_parser = target.key_parser
+                self.heavy_deps = self.heavy_deps or target.heavy_deps
+                self.description = self.description or target.description
+                target = target.load()
+            self._cls = target
+        return self._cls
+
+    def create(self, key: str):
+        """Buat instance cipher dari string kunci"""
+        return self.load()(*self.key_parser(key))
+
+    def is_loaded(self) -> bool:
+        return self._cls is not None
+
+
+_registry = {}
+_entry_points_loaded = False
+_lock = threading.Lock()
+
+
+def register(spec: CipherSpec, replace: bool = False):
+    """Daftarkan cipher ke registry"""
+    with _lock:
+        if spec.name in _registry and not replace:
+            raise ValueError(f"Cipher sudah terdaftar: {spec.name}")
+        _registry[spec.name] = spec
+
+
+def register_cipher(name: str, target: str, key_parser=parse_text_key,
+                    heavy_deps: tuple = (), description: str = ''):
+    """Shortcut untuk register(CipherSpec(...))"""
+    register(CipherSpec(name, target, key_parser, heavy_deps, description))
+
+
+def _load_entry_points():
+    """
+    Daftarkan cipher pihak ketiga dari entry point (hanya sekali). Modul
+    plugin belum di-import di sini, baru saat cipher-nya pertama kali dipakai.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+
+    # importlib.metadata relatif mahal, jadi baru di-import di sini
+    from importlib.metadata import entry_points
+
+    discovered = entry_points(group=ENTRY_POINT_GROUP)
+    with _lock:
+        if _entry_points_loaded:
+            return
+        for entry_point in discovered:
+            if entry_point.name in _registry:
+                continue
+            if not entry_point.attr:
+                logger.warning("Entry point cipher %s tidak valid: %r (format 'modul:objek')",
+                               entry_point.name, entry_point.value)
+                continue
+            _registry[entry_point.name] = CipherSpec(
+                entry_point.name, f'{entry_point.module}:{entry_point.attr}'
+            )
+        # Flag baru di-set setelah registry terisi agar lookup paralel tidak
+        # melihat registry yang belum lengkap
+        _entry_points_loaded = True
+
+
+def get_spec(name: str) -> CipherSpec:
+    """Spec cipher berdasarkan nama"""
+    spec = _registry.get(name)
+    if spec is None:
+        _load_entry_points()
+        spec = _registry.get(name)
+    if spec is None:
+        raise ValueError(f"Tipe cipher tidak valid: {name}")
+    return spec
+
+
+def create_cipher(cipher_type: str, key: str):
+    """Mengembalikan instance cipher berdasarkan tipe"""
+    return get_spec(cipher_type).create(key)
+
+
+def available_ciphers() -> list:
+    """Nama semua cipher terdaftar, termasuk dari entry point"""
+    _load_entry_points()
+    return sorted(_registry)
+
+
+# Cipher bawaan
+register_cipher('shift', 'ciphers:ShiftCipher', parse_shift_key,
+                description='Shift Cipher (Caesar Cipher)')
+register_cipher('substitution', 'ciphers:SubstitutionCipher',
+                description='Substitution Cipher')
+register_cipher('affine', 'ciphers:AffineCipher', parse_affine_key,
+                description='Affine Cipher')
+register_cipher('vigenere', 'ciphers:VigenereCipher',
+                description='Vigenere Cipher')
+# Matriks kunci Hill langsung diolah dengan NumPy
+register_cipher('hill', 'ciphers:HillCipher', heavy_deps=('numpy',),
+                description='Hill Cipher')
+register_cipher('permutation', 'ciphers:PermutationCipher',
+                description='Permutation Cipher')
@@ -6,6 +6,14 @@
 // Global variables
 let selectedFile = null;
 let currentResult = '';
+let liveSession = null;
+let liveTimer = null;
+let liveBusy = false;
+
+// Chunked upload settings
+const UPLOAD_CHUNK_SIZE = 1024 * 1024;
+const UPLOAD_PARALLELISM = 4;
+const UPLOAD_RETRIES = 3;
 
 // Cipher information mapping
 const cipherInfoMap = {
@@ -67,6 +75,22 @@ function setupEventListeners() {
         radio.addEventListener('change', toggleInputMode);
     });
 
+    // Live incremental encryption
+    const liveMode = document.getElementById('liveMode');
+    if (liveMode) {
+        liveMode.addEventListener('change', toggleLiveMode);
+    }
+    const plainText = document.getElementById('plainText');
+    if (plainText) {
+        plainText.addEventListener('input', scheduleLiveUpdate);
+    }
+    ['cipherType', 'keyInput'].forEach(id => {
+        const element = document.getElementById(id);
+        if (element) {
+            element.addEventListener('change', restartLiveSession);
+        }
+    });
+
     // Format options
     const formatRadios = document.querySelectorAll('input[name="format"]');
     formatRadios.forEach(radio => {
@@ -206,6 +230,10 @@ function showLoading() {
     if (loadingIndicator) {
         loadingIndicator.style.display = 'block';
     }
+    const loadingText = document.getElementById('loadingText');
+    if (loadingText) {
+        loadingText.textContent = 'Memproses...';
+    }
     if (resultsSection) {
         resultsSection.style.display = 'none';
     }
@@ -348,22 +376,10 @@ async function encryptText(cipherType, key) {
         return;
     }
     
-    const response = await fetch('/encrypt', {
-        method: 'POST',
-        headers: {
-            'Content-Type': 'application/json',
-        },
-        body: JSON.stringify({
-            cipher_type: cipherType,
-            text: text,
-            key: key
-        })
-    });
-    
-    const result = await response.json();
+    const result = await postRawText('/encrypt/raw', cipherType, key, text);
     
     if (result.success) {
-        showResults(result.encrypted_text);
+        showResults(result.text);
         showSuccess('Teks berhasil dienkripsi!');
     } else {
         showError('Error: ' + result.error);
@@ -371,7 +387,7 @@ async function encryptText(cipherType, key) {
 }
 
 /**
- * Encrypt file
+ * Encrypt file using chunked, resumable upload
  */
 async function encryptFile(cipherType, key) {
     if (!selectedFile) {
@@ -379,17 +395,7 @@ async function encryptFile(cipherType, key) {
         return;
     }
     
-    const formData = new FormData();
-    formData.append('file', selectedFile);
-    formData.append('cipher_type', cipherType);
-    formData.append('key', key);
-    
-    const response = await fetch('/encrypt', {
-        method: 'POST',
-        body: formData
-    });
-    
-    const result = await response.json();
+    const result = await uploadFileChunked(selectedFile, cipherType, key);
     
     if (result.success) {
         showResults('File berhasil dienkripsi!', true);
@@ -401,6 +407,146 @@ async function encryptFile(cipherType, key) {
     }
 }
 
+/**
+ * Upload a file in numbered chunks (Blob.slice) sent in parallel. The upload
+ * id is kept in localStorage so an interrupted upload resumes from the
+ * chunks the server has already acknowledged.
+ */
+async function uploadFileChunked(file, cipherType, key) {
+    const headers = {
+        'X-Cipher-Type': cipherType,
+        'X-Cipher-Key': encodeURIComponent(key)
+    };
+    const storageKey = `upload:${file.name}:${file.size}:${file.lastModified}:${cipherType}`;
+    
+    let upload = await resumeUpload(localStorage.getItem(storageKey), headers);
+    if (!upload) {
+        const response = await fetch('/upload/init', {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json'
+            },
+            body: JSON.stringify({
+                cipher_type: cipherType,
+                key: key,
+                file_name: file.name,
+                size: file.size,
+                chunk_size: UPLOAD_CHUNK_SIZE
+            })
+        });
+        upload = await response.json();
+        if (!upload.success) {
+            return upload;
+        }
+        localStorage.setItem(storageKey, upload.upload_id);
+    }
+    // Chunk dan complete diautentikasi dengan token dari init/resume
+    headers['X-Upload-Token'] = upload.token;
+    
+    const received = new Set(upload.received);
+    const pending = [];
+    for (let index = 0; index < upload.chunk_count; index++) {
+        if (!received.has(index)) {
+            pending.push(index);
+        }
+    }
+    
+    let done = received.size;
+    updateUploadProgress(done, upload.chunk_count);
+    
+    // Beberapa worker mengambil chunk berikutnya dari antrian yang sama
+    const worker = async () => {
+        while (pending.length > 0) {
+            const index = pending.shift();
+            const start = index * upload.chunk_size;
+            await sendChunk(upload.upload_id, index, file.slice(start, start + upload.chunk_size), headers);
+            done++;
+            updateUploadProgress(done, upload.chunk_count);
+        }
+    };
+    
+    try {
+        const workers = [];
+        for (let i = 0; i < Math.min(UPLOAD_PARALLELISM, pending.length); i++) {
+            workers.push(worker());
+        }
+        await Promise.all(workers);
+    } catch (error) {
+        return { success: false, error: error.message + ' (klik Enkripsi lagi untuk melanjutkan upload)' };
+    }
+    
+    const response = await fetch(`/upload/${upload.upload_id}/complete`, {
+        method: 'POST',
+        headers: headers
+    });
+    const result = await response.json();
+    if (result.success) {
+        localStorage.removeItem(storageKey);
+    }
+    return result;
+}
+
+/**
+ * Resume a previous upload (the server verifies the key once and returns a
+ * fresh status plus the upload token), null if it cannot be resumed
+ */
+async function resumeUpload(uploadId, headers) {
+    if (!uploadId) {
+        return null;
+    }
+    try {
+        const response = await fetch(`/upload/${uploadId}/resume`, { method: 'POST', headers: headers });
+        const status = await response.json();
+        if (status.success && !status.complete) {
+            return status;
+        }
+    } catch (error) {
+        // Server tidak bisa dihubungi, mulai upload baru
+    }
+    return null;
+}
+
+/**
+ * Send a single chunk, retrying a few times on failure
+ */
+async function sendChunk(uploadId, index, blob, headers) {
+    let lastError = null;
+    for (let attempt = 0; attempt < UPLOAD_RETRIES; attempt++) {
+        try {
+            const response = await fetch(`/upload/${uploadId}/chunk/${index}`, {
+                method: 'PUT',
+                headers: {
+                    ...headers,
+                    'Content-Type': 'application/octet-stream'
+                },
+                body: blob
+            });
+            const result = await response.json();
+            if (result.success) {
+                return;
+            }
+            lastError = new Error(result.error);
+            if (response.status !== 503) {
+                break;
+            }
+        } catch (error) {
+            lastError = error;
+        }
+        await new Promise(resolve => setTimeout(resolve, 500 * (attempt + 1)));
+    }
+    throw lastError;
+}
+
+/**
+ * Show upload progress in the loading indicator
+ */
+function updateUploadProgress(done, total) {
+    const loadingText = document.getElementById('loadingText');
+    if (loadingText && total > 0) {
+        loadingText.textContent = `Mengupload... ${Math.round(done / total * 100)}%`;
+    }
+}
+
 /**
  * Decrypt function
  */
@@ -439,26 +585,45 @@ async function decryptText(cipherType, key) {
         return;
     }
     
-    const response = await fetch('/decrypt', {
+    const result = await postRawText('/decrypt/raw', cipherType, key, text);
+    
+    if (result.success) {
+        showResults(result.text);
+        showSuccess('Teks berhasil didekripsi!');
+    } else {
+        showError('Error: ' + result.error);
+    }
+}
+
+/**
+ * Send text as a raw text/plain body (no JSON escaping) and read the
+ * streamed plain text response
+ */
+async function postRawText(url, cipherType, key, text) {
+    const response = await fetch(url, {
         method: 'POST',
         headers: {
-            'Content-Type': 'application/json',
+            'Content-Type': 'text/plain; charset=utf-8',
+            'X-Cipher-Type': cipherType,
+            'X-Cipher-Key': encodeURIComponent(key)
         },
-        body: JSON.stringify({
-            cipher_type: cipherType,
-            text: text,
-            key: key
-        })
+        body: text
     });
     
-    const result = await response.json();
+    if (!response.ok) {
+        const error = await response.json();
+        return { success: false, error: error.error };
+    }
     
-    if (result.success) {
-        showResults(result.decrypted_text);
-        showSuccess('Teks berhasil didekripsi!');
-    } else {
-        showError('Error: ' + result.error);
+    // Error setelah stream dimulai ditandai token dari header X-Stream-Error-Token
+    const text = await response.text();
+    const token = response.headers.get('X-Stream-Error-Token');
+    const errorAt = token ? text.indexOf(token) : -1;
+    if (errorAt >= 0) {
+        return { success: false, error: text.slice(errorAt + token.length) };
     }
+    
+    return { success: true, text: text };
 }
 
 /**
@@ -478,6 +643,10 @@ async function decryptFile(cipherType, key) {
     
     const response = await fetch('/decrypt', {
         method: 'POST',
+        // Tipe cipher di header agar server bisa mengestimasi memori sebelum parsing
+        headers: {
+            'X-Cipher-Type': cipherType
+        },
         body: formData
     });
     
@@ -493,6 +662,165 @@ async function decryptFile(cipherType, key) {
     }
 }
 
+/**
+ * Check whether live mode is enabled
+ */
+function isLiveMode() {
+    const liveMode = document.getElementById('liveMode');
+    return liveMode && liveMode.checked;
+}
+
+/**
+ * Toggle live incremental encryption
+ */
+async function toggleLiveMode() {
+    if (isLiveMode()) {
+        await startLiveSession();
+    } else {
+        endLiveSession();
+    }
+}
+
+/**
+ * Restart the live session when cipher or key changes
+ */
+async function restartLiveSession() {
+    if (isLiveMode()) {
+        await startLiveSession();
+    }
+}
+
+/**
+ * Start a server-side incremental session with the full current text
+ */
+async function startLiveSession() {
+    endLiveSession();
+    
+    const cipherType = document.getElementById('cipherType').value;
+    const key = document.getElementById('keyInput').value;
+    const text = document.getElementById('plainText').value;
+    
+    if (!key) {
+        showError('Masukkan kunci terlebih dahulu!');
+        document.getElementById('liveMode').checked = false;
+        return;
+    }
+    
+    const response = await fetch('/incremental/start', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json',
+            'X-Cipher-Type': cipherType
+        },
+        body: JSON.stringify({
+            cipher_type: cipherType,
+            key: key,
+            direction: 'encrypt',
+            text: text
+        })
+    });
+    
+    const result = await response.json();
+    
+    if (result.success) {
+        liveSession = { id: result.session_id, text: text };
+        showResults(result.result);
+    } else {
+        showError('Error: ' + result.error);
+    }
+}
+
+/**
+ * End the current live session
+ */
+function endLiveSession() {
+    if (liveSession) {
+        fetch(`/incremental/${liveSession.id}`, { method: 'DELETE' });
+        liveSession = null;
+    }
+}
+
+/**
+ * Debounce edits while typing
+ */
+function scheduleLiveUpdate() {
+    if (!isLiveMode()) return;
+    clearTimeout(liveTimer);
+    liveTimer = setTimeout(sendLiveEdit, 150);
+}
+
+/**
+ * Compute a single (offset, deleted, inserted) edit from common prefix/suffix
+ */
+function computeEdit(oldText, newText) {
+    const limit = Math.min(oldText.length, newText.length);
+    let prefix = 0;
+    while (prefix < limit && oldText[prefix] === newText[prefix]) {
+        prefix++;
+    }
+    let suffix = 0;
+    while (suffix < limit - prefix &&
+           oldText[oldText.length - 1 - suffix] === newText[newText.length - 1 - suffix]) {
+        suffix++;
+    }
+    if (prefix === oldText.length && prefix === newText.length) {
+        return null;
+    }
+    return {
+        offset: prefix,
+        deleted: oldText.length - prefix - suffix,
+        inserted: newText.slice(prefix, newText.length - suffix)
+    };
+}
+
+/**
+ * Send the pending edit and apply the returned ciphertext diffs
+ */
+async function sendLiveEdit() {
+    if (!liveSession) return;
+    // Only one request in flight so edits are applied in order
+    if (liveBusy) {
+        scheduleLiveUpdate();
+        return;
+    }
+    
+    const text = document.getElementById('plainText').value;
+    // Server offsets count code points, JS counts UTF-16 units
+    if (/[\uD800-\uDFFF]/.test(text)) {
+        await startLiveSession();
+        return;
+    }
+    
+    const edit = computeEdit(liveSession.text, text);
+    if (!edit) return;
+    
+    liveBusy = true;
+    try {
+        const response = await fetch(`/incremental/${liveSession.id}/edit`, {
+            method: 'POST',
+            headers: {
+                'Content-Type': 'application/json',
+            },
+            body: JSON.stringify({ edits: [edit] })
+        });
+        const result = await response.json();
+        
+        if (result.success) {
+            liveSession.text = text;
+            let output = currentResult;
+            result.diffs.forEach(diff => {
+                output = output.slice(0, diff.offset) + diff.inserted + output.slice(diff.offset + diff.deleted);
+            });
+            showResults(output);
+        } else {
+            // Session expired or out of sync: start over with the full text
+            await startLiveSession();
+        }
+    } finally {
+        liveBusy = false;
+    }
+}
+
 /**
  * Format result text
  */
@@ -530,10 +858,141 @@ function downloadResult() {
     }
 }
 
+/**
+ * Fill the key input with a random valid key for the selected cipher
+ */
+async function generateKey() {
+    const cipherType = document.getElementById('cipherType').value;
+    const keyInput = document.getElementById('keyInput');
+    
+    try {
+        const response = await fetch(`/keygen?cipher_type=${encodeURIComponent(cipherType)}`);
+        const result = await response.json();
+        
+        if (result.success) {
+            keyInput.value = result.keys[0];
+            keyInput.dispatchEvent(new Event('change'));
+        } else {
+            showError('Error: ' + result.error);
+        }
+    } catch (error) {
+        showError('Terjadi kesalahan: ' + error.message);
+    }
+}
+
+/**
+ * Frequency analysis of the current text or selected file
+ */
+async function analyze() {
+    const inputMode = document.querySelector('input[name="inputMode"]:checked').value;
+    let body;
+    let contentType;
+    
+    if (inputMode === 'text') {
+        body = document.getElementById('plainText').value;
+        contentType = 'text/plain; charset=utf-8';
+        if (!body) {
+            showError('Masukkan teks terlebih dahulu!');
+            return;
+        }
+    } else {
+        // File dikirim sebagai body raw agar server bisa membacanya per chunk
+        body = selectedFile;
+        contentType = 'application/octet-stream';
+        if (!body) {
+            showError('Pilih file terlebih dahulu!');
+            return;
+        }
+    }
+    
+    showLoading();
+    
+    try {
+        const response = await fetch('/analyze?top=10', {
+            method: 'POST',
+            headers: {
+                'Content-Type': contentType
+            },
+            body: body
+        });
+        const result = await response.json();
+        
+        if (result.success) {
+            showAnalysis(result.analysis);
+        } else {
+            showError('Error: ' + result.error);
+        }
+    } catch (error) {
+        showError('Terjadi kesalahan: ' + error.message);
+    }
+    
+    hideLoading();
+}
+
+/**
+ * Render letter histogram and top n-grams
+ */
+function showAnalysis(analysis) {
+    const section = document.getElementById('analysisSection');
+    const histogram = document.getElementById('letterHistogram');
+    const total = analysis.letters || 1;
+    const maxCount = Math.max(1, ...Object.values(analysis.unigrams));
+    
+    histogram.innerHTML = '';
+    Object.entries(analysis.unigrams).forEach(([letter, count]) => {
+        const column = document.createElement('div');
+        column.className = 'frequency-column';
+        column.title = `${letter}: ${count} (${(count / total * 100).toFixed(2)}%)`;
+        
+        const bar = document.createElement('div');
+        bar.className = 'frequency-bar';
+        bar.style.height = `${count / maxCount * 100}%`;
+        
+        const label = document.createElement('span');
+        label.className = 'frequency-label';
+        label.textContent = letter;
+        
+        column.appendChild(bar);
+        column.appendChild(label);
+        histogram.appendChild(column);
+    });
+    
+    renderNgrams('bigramList', analysis.bigrams);
+    renderNgrams('trigramList', analysis.trigrams);
+    
+    document.getElementById('analysisSummary').textContent =
+        `Huruf: ${analysis.letters} | IoC: ${analysis.index_of_coincidence.toFixed(4)} ` +
+        `(Inggris ${analysis.english_ioc.toFixed(4)}, acak ${analysis.random_ioc.toFixed(4)}) | ` +
+        `Chi-squared: ${analysis.chi_squared.toFixed(1)} | Kemungkinan shift: ${analysis.likely_shift}`;
+    
+    section.style.display = 'block';
+}
+
+/**
+ * Render a list of [ngram, count] pairs as badges
+ */
+function renderNgrams(elementId, ngrams) {
+    const container = document.getElementById(elementId);
+    container.innerHTML = '';
+    ngrams.forEach(([ngram, count]) => {
+        const badge = document.createElement('span');
+        badge.className = 'ngram-badge';
+        badge.textContent = `${ngram} ${count}`;
+        container.appendChild(badge);
+    });
+}
+
 /**
  * Clear all inputs and results
  */
 function clearAll() {
+    // Stop live mode
+    endLiveSession();
+    const liveMode = document.getElementById('liveMode');
+    if (liveMode) {
+        liveMode.checked = false;
+    }
+    
     // Clear text input
     const plainText = document.getElementById('plainText');
     if (plainText) {
@@ -564,6 +1023,10 @@ function clearAll() {
     if (resultsSection) {
         resultsSection.style.display = 'none';
     }
+    const analysisSection = document.getElementById('analysisSection');
+    if (analysisSection) {
+        analysisSection.style.display = 'none';
+    }
     
     // Reset to text mode
     const textMode = document.getElementById('textMode');
@@ -600,3 +1063,4 @@ window.formatResult = formatResult;
 window.downloadResult = downloadResult;
 window.clearAll = clearAll;
 window.copyResult = copyResult;
+window.analyze = analyze;
@@ -3,10 +3,29 @@
 Script untuk testing semua cipher
 """
 
+import io
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import threading
+import zipfile
+
 from ciphers import (
     ShiftCipher, SubstitutionCipher, AffineCipher,
     VigenereCipher, HillCipher, PermutationCipher
 )
+from container import ContainerWriter, ContainerReader
+from bulk import bulk_encrypt
+from cache import ResultCache, make_cache_key
+from incremental import IncrementalSession
+from uploads import UploadStore
+from attack import Wordlist, dictionary_attack, keyword_alphabet
+from keygen import KeyPool, generate_keys, key_letters, random_permutations
+from registry import create_cipher, get_spec
+from analysis import FrequencyAnalyzer, analyze_stream
+from admission import MemoryBudget, MemoryProfiler, AdmissionRejected, estimate_peak_bytes
 
 def test_shift_cipher():
     print("=== Testing Shift Cipher ===")
@@ -106,6 +125,463 @@ def test_file_encryption():
     print(f"Success: {test_data == decrypted_data}")
     print()
 
+def test_container_format():
+    print("=== Testing Container Format ===")
+    cipher = ShiftCipher(7)
+    test_data = bytes(range(256)) * 40
+    
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.dat')
+    with ContainerWriter(temp_file, 'shift', '7', cipher, chunk_size=1000) as writer:
+        writer.write(test_data)
+    temp_file.close()
+    
+    with ContainerReader(temp_file.name, cipher) as reader:
+        print(f"Chunks: {len(reader.chunks)}, original length: {reader.original_length}")
+        # Kunci ekuivalen (7 dan 33) harus cocok
+        key_ok = (reader.matches_key('shift', '7') and reader.matches_key('shift', '33')
+                  and not reader.matches_key('shift', '8'))
+        full = reader.read_all()
+        partial = reader.read_range(1500, 4321)
+    os.remove(temp_file.name)
+    
+    expected = cipher.decrypt_bytes(cipher.encrypt_bytes(test_data))
+    success = key_ok and full == expected and partial == expected[1500:4321]
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_stream_encryption():
+    print("=== Testing Stream Encryption ===")
+    plaintext = "The quick brown fox, jumps over the lazy dog! " * 50
+    chunks = [plaintext[i:i + 17] for i in range(0, len(plaintext), 17)]
+    
+    success = True
+    for cipher in [VigenereCipher("KEYWORD"), HillCipher("GYBNQKURP"), PermutationCipher("3,1,0,2")]:
+        streamed = ''.join(cipher.encrypt_stream(chunks))
+        # Huruf jarang: potongan berisi satu huruf atau tanpa huruf sama sekali
+        sparse = ''.join(cipher.decrypt_stream(["a" + " " * 40, " " * 40, "b.c" + " " * 10] * 5))
+        match = (streamed == cipher.encrypt(plaintext)
+                 and sparse == cipher.decrypt(("a" + " " * 80 + "b.c" + " " * 10) * 5))
+        print(f"{type(cipher).__name__}: {match}")
+        success = success and match
+    
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_engine_dispatch():
+    print("=== Testing Engine Dispatch ===")
+    plaintext = "Attack at dawn, retreat at dusk! " * 100
+    
+    success = True
+    for cipher in [ShiftCipher(3), AffineCipher(5, 8), VigenereCipher("KEYWORD"),
+                   HillCipher("GYBNQKURP"), PermutationCipher("2,0,1")]:
+        expected = cipher._encrypt_scalar(plaintext)
+        for engine in cipher.engines:
+            if engine == 'process':
+                continue
+            match = getattr(cipher, f'_encrypt_{engine}')(plaintext) == expected
+            print(f"{type(cipher).__name__} [{engine}]: {match}")
+            success = success and match
+        
+        cipher.encrypt("HELLO")
+        print(f"{type(cipher).__name__} short text engine: {cipher.last_engine}")
+    
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_hill_binary():
+    print("=== Testing Hill Binary Mode (mod 256) ===")
+    cipher = HillCipher("GYBNQKURP")
+    test_data = bytes(range(256)) * 3 + b"tail"
+    
+    encrypted_data = cipher.encrypt_bytes(test_data)
+    decrypted_data = cipher.decrypt_bytes(encrypted_data)
+    print(f"Original length: {len(test_data)}, encrypted length: {len(encrypted_data)}")
+    
+    temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.dat')
+    with ContainerWriter(temp_file, 'hill', 'GYBNQKURP', cipher, chunk_size=100) as writer:
+        writer.write(test_data)
+    temp_file.close()
+    with ContainerReader(temp_file.name, cipher) as reader:
+        container_data = reader.read_all()
+    os.remove(temp_file.name)
+    
+    success = decrypted_data == test_data and container_data == test_data
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_bulk_encryption():
+    print("=== Testing Bulk Encryption ===")
+    cipher = VigenereCipher("KEYWORD")
+    
+    with tempfile.TemporaryDirectory() as work_dir:
+        source = os.path.join(work_dir, 'source')
+        os.makedirs(os.path.join(source, 'sub'))
+        files = {'a.txt': b"small file", 'sub/big.bin': os.urandom(300 * 1024)}
+        for name, data in files.items():
+            with open(os.path.join(source, name), 'wb') as f:
+                f.write(data)
+        
+        output = os.path.join(work_dir, 'output')
+        manifest = bulk_encrypt(source, output, 'vigenere', 'KEYWORD',
+                                workers=2, executor='thread', chunk_size=64 * 1024)
+        print(f"Files: {manifest['file_count']}, modes: {[e['mode'] for e in manifest['files']]}")
+        
+        success = manifest['file_count'] == len(files)
+        for name, data in files.items():
+            with ContainerReader(os.path.join(output, name + '.dat'), cipher) as reader:
+                success = success and reader.read_all() == cipher.decrypt_bytes(cipher.encrypt_bytes(data))
+        
+        # Output .tar: isi kontainer disalin apa adanya ke arsip
+        tar_path = os.path.join(work_dir, 'output.tar')
+        bulk_encrypt(source, tar_path, 'vigenere', 'KEYWORD', workers=2, executor='thread',
+                     chunk_size=64 * 1024)
+        tar_dir = os.path.join(work_dir, 'from_tar')
+        with tarfile.open(tar_path) as tf:
+            names = sorted(tf.getnames())
+            tf.extractall(tar_dir, filter='data')
+        tar_same = True
+        for name, data in files.items():
+            with ContainerReader(os.path.join(tar_dir, name + '.dat'), cipher) as reader:
+                tar_same = tar_same and reader.read_all() == cipher.decrypt_bytes(cipher.encrypt_bytes(data))
+        tar_ok = names == sorted([name + '.dat' for name in files] + ['manifest.json']) and tar_same
+        print(f"Tar output: {names}, valid={tar_ok}")
+        success = success and tar_ok
+        
+        # Zip bomb kecil: isi 10MB nol dalam arsip beberapa KB harus ditolak
+        bomb = os.path.join(work_dir, 'bomb.zip')
+        with zipfile.ZipFile(bomb, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr('zeros.bin', bytes(10 * 1024 * 1024))
+        try:
+            bulk_encrypt(bomb, os.path.join(work_dir, 'bomb_out'), 'vigenere', 'KEYWORD',
+                         executor='thread', max_extract_bytes=1024 * 1024)
+            bomb_rejected = False
+        except ValueError:
+            bomb_rejected = True
+        print(f"Zip bomb rejected: {bomb_rejected}")
+        success = success and bomb_rejected
+    
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_result_cache():
+    print("=== Testing Result Cache ===")
+    cache = ResultCache(max_bytes=1024)
+    cipher = ShiftCipher(3)
+    key = make_cache_key(cipher.name, cipher.normalized_key(), 'encrypt', "HELLO WORLD")
+    
+    first = cache.get(key)
+    cache.put(key, cipher.encrypt("HELLO WORLD"))
+    second = cache.get(key)
+    
+    # Kunci yang ekuivalen (3 dan 29) harus menghasilkan kunci cache yang sama
+    same_key = key == make_cache_key('shift', ShiftCipher(29).normalized_key(), 'encrypt', "HELLO WORLD")
+    
+    # Isi melebihi batas byte, entri paling lama harus dibuang
+    for i in range(50):
+        cache.put(f'filler{i}', 'X' * 100)
+    stats = cache.stats()
+    print(f"Stats: {stats}")
+    
+    # Satu entri pendek dihitung beserta kunci dan overhead entri, bukan hanya nilainya
+    single = ResultCache(max_bytes=1024)
+    single.put(key, "KHOOR ZRUOG")
+    entry_bytes = single.stats()['memory_bytes']
+    
+    # bytes_saved menghitung byte UTF-8, bukan karakter
+    single.put('unicode', "ÉÉÉ")
+    single.get('unicode')
+    bytes_saved = single.stats()['bytes_saved']
+    
+    # File tier disk sisa process sebelumnya dihapus saat start
+    with tempfile.TemporaryDirectory() as disk_dir:
+        for name in ('stale.cache', 'stale.cache.1.tmp', 'other.txt'):
+            open(os.path.join(disk_dir, name), 'w').close()
+        ResultCache(disk_dir=disk_dir)
+        swept = os.listdir(disk_dir) == ['other.txt']
+    print(f"Entry bytes: {entry_bytes}, bytes saved: {bytes_saved}, swept: {swept}")
+    
+    success = (first is None and second == "KHOOR ZRUOG" and same_key
+               and cache.get(key) is None and stats['memory_bytes'] <= 1024
+               and entry_bytes >= sys.getsizeof("KHOOR ZRUOG") + sys.getsizeof(key) + 100
+               and bytes_saved == 6 and swept)
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_incremental_encryption():
+    print("=== Testing Incremental Encryption ===")
+    edits = [(0, 0, "Dear "), (11, 5, "there"), (4, 1, ", "), (20, 0, " and goodbye"), (0, 3, "")]
+    
+    success = True
+    for cipher in [AffineCipher(5, 8), VigenereCipher("KEYWORD"), HillCipher("GYBNQKURP"), PermutationCipher("2,0,1")]:
+        session = IncrementalSession(cipher, 'encrypt', "hello world, again")
+        client_view = session.output
+        
+        for offset, deleted, inserted in edits:
+            diff = session.apply_edit(offset, deleted, inserted)
+            client_view = (client_view[:diff['offset']] + diff['inserted']
+                           + client_view[diff['offset'] + diff['deleted']:])
+        
+        match = client_view == session.output == cipher.encrypt(session.text)
+        print(f"{type(cipher).__name__}: {match}")
+        success = success and match
+    
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_cold_start_import():
+    print("=== Testing Cold Start Import ===")
+    # Cipher tanpa heavy_deps tidak boleh meng-import NumPy dan harus muat
+    # di budget; cipher yang mendeklarasikan NumPy memang harus memuatnya
+    budget_us = 150 * 1000
+    keys = {'shift': '3', 'substitution': 'ZYXWVUTSRQPONMLKJIHGFEDCBA', 'affine': '5,8',
+            'vigenere': 'KEY', 'hill': 'GYBNQKURP', 'permutation': '2,0,1'}
+    
+    success = True
+    for cipher_type, key in keys.items():
+        heavy = 'numpy' in get_spec(cipher_type).heavy_deps
+        code = f"import registry; print(registry.create_cipher({cipher_type!r}, {key!r}).encrypt('HELLO WORLD'))"
+        result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                                capture_output=True, text=True,
+                                cwd=os.path.dirname(os.path.abspath(__file__)))
+        
+        modules = {}
+        for line in result.stderr.splitlines():
+            if line.startswith('import time:') and '|' in line:
+                _, cumulative, name = line.split('|')
+                if cumulative.strip().isdigit():
+                    modules[name.rstrip()] = int(cumulative)
+        
+        # Modul level atas (tanpa indentasi) adalah registry dan ciphers
+        own_time = sum(t for name, t in modules.items() if name.strip() in ('registry', 'ciphers'))
+        numpy_loaded = any(name.strip().split('.')[0] == 'numpy' for name in modules)
+        ok = result.returncode == 0 and numpy_loaded == heavy and (heavy or own_time < budget_us)
+        print(f"{cipher_type}: {own_time / 1000:.1f} ms, numpy={numpy_loaded}, heavy_deps={heavy}, ok={ok}")
+        success = success and ok
+    
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_registry_entry_points():
+    print("=== Testing Registry Entry Points ===")
+    with tempfile.TemporaryDirectory() as plugin_dir:
+        dist_info = os.path.join(plugin_dir, 'rot13_plugin-1.0.dist-info')
+        os.makedirs(dist_info)
+        with open(os.path.join(dist_info, 'METADATA'), 'w') as f:
+            f.write("Metadata-Version: 2.1\nName: rot13-plugin\nVersion: 1.0\n")
+        with open(os.path.join(dist_info, 'entry_points.txt'), 'w') as f:
+            f.write("[kriptosistem.ciphers]\nrot13 = rot13_plugin:Rot13\n")
+        with open(os.path.join(plugin_dir, 'rot13_plugin.py'), 'w') as f:
+            f.write("from ciphers import ShiftCipher\n"
+                    "class Rot13(ShiftCipher):\n"
+                    "    def __init__(self, key=''):\n"
+                    "        super().__init__(13)\n")
+        
+        # Modul plugin baru di-import saat cipher-nya dipakai
+        code = ("import sys, registry; names = registry.available_ciphers(); "
+                "before = 'rot13_plugin' in sys.modules; "
+                "print('rot13' in names, before, registry.create_cipher('rot13', '').encrypt('HELLO'))")
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join([os.path.dirname(os.path.abspath(__file__)), plugin_dir]))
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env)
+    
+    output = result.stdout.strip()
+    print(f"Output: {output}")
+    success = output == "True False URYYB"
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_memory_admission():
+    print("=== Testing Memory Admission ===")
+    size = 1024 * 1024
+    budget = MemoryBudget(limit_bytes=10 * size, max_wait=0.05)
+    
+    # Request pertama mengisi budget, request kedua ditolak setelah menunggu
+    first = budget.acquire(8 * size)
+    try:
+        budget.acquire(4 * size)
+        rejected = False
+    except AdmissionRejected as e:
+        rejected = e.retry_after >= 1
+    
+    # Request yang menunggu masuk setelah reservasi dilepas
+    budget.max_wait = 5
+    admitted = []
+    waiter = threading.Thread(target=lambda: admitted.append(budget.acquire(4 * size)))
+    waiter.start()
+    budget.release(first, 0.01)
+    waiter.join()
+    budget.release(admitted[0])
+    
+    # Estimasi di atas budget dibatasi ke budget
+    oversized = budget.acquire(100 * size)
+    budget.release(oversized)
+    
+    profiler = MemoryProfiler(sample_rate=1.0)
+    sampled = profiler.start()
+    buffer = bytearray(4 * size)
+    peak = profiler.stop(sampled)
+    del buffer
+    profiler.record('text:shift', estimate_peak_bytes('text', 'shift', size), peak)
+    
+    print(f"Rejected: {rejected}, admitted after release: {admitted}")
+    print(f"Peak: {peak}, stats: {profiler.stats()['requests']}")
+    success = (rejected and admitted == [4 * size] and oversized == 10 * size
+               and budget.stats()['in_use_bytes'] == 0 and peak >= 4 * size
+               and estimate_peak_bytes('text', 'vigenere', size) > estimate_peak_bytes('text', 'shift', size))
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_frequency_analysis():
+    print("=== Testing Frequency Analysis ===")
+    plaintext = "Attack at dawn, then retreat to the northern hills before the storm. " * 50
+    ciphertext = ShiftCipher(7).encrypt(plaintext).encode('ascii')
+    
+    # Chunk kecil memotong n-gram di batas chunk
+    streamed = analyze_stream(ciphertext[i:i + 7] for i in range(0, len(ciphertext), 7))
+    whole = analyze_stream([ciphertext])
+    
+    letters = ''.join(c for c in ciphertext.decode() if c.isalpha())
+    analyzer = FrequencyAnalyzer()
+    analyzer.update(ciphertext)
+    expected_bigrams = sum(1 for i in range(len(letters) - 1) if letters[i:i + 2] == 'AO')
+    
+    print(f"Letters: {streamed['letters']}, IoC: {streamed['index_of_coincidence']:.4f}")
+    print(f"Top trigrams: {streamed['trigrams'][:3]}, likely shift: {streamed['likely_shift']}")
+    success = (streamed == whole and streamed['letters'] == len(letters)
+               and sum(n for _, n in analyze_stream([ciphertext], top=1000)['trigrams']) == len(letters) - 2
+               and int(analyzer.bigrams[0 * 26 + 14]) == expected_bigrams
+               and streamed['likely_shift'] == 7)
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_chunked_upload():
+    print("=== Testing Chunked Upload ===")
+    test_data = bytes(range(256)) * 40 + b"tail"
+    chunk_size = 999
+    
+    success = True
+    for cipher_type, key in [("hill", "GYBNQKURP"), ("shift", "3")]:
+        cipher = HillCipher(key) if cipher_type == "hill" else ShiftCipher(3)
+        with tempfile.TemporaryDirectory() as upload_dir:
+            store = UploadStore(upload_dir)
+            upload = store.create("data.bin", len(test_data), cipher_type, key, cipher, chunk_size)
+            size = upload.state['chunk_size']
+            order = list(range(upload.state['chunk_count']))[::-1]
+            
+            # Setengah chunk dikirim, lalu "restart": state dibaca ulang dari disk
+            for index in order[:3]:
+                upload.write_chunk(index, test_data[index * size:(index + 1) * size], cipher)
+            resumed = UploadStore(upload_dir).get(upload.upload_id)
+            token = resumed.resume(cipher_type, key)
+            # Token dari resume sama dengan dari create dan hanya berlaku untuk kunci yang sama
+            token_ok = (token == upload.token and resumed.resume(cipher_type, key + "X") is None
+                        and resumed.check_token(token, cipher_type, key)
+                        and not resumed.check_token(token, cipher_type, key + "X")
+                        and not resumed.check_token(token[::-1], cipher_type, key))
+            resumed_ok = resumed.received() == sorted(order[:3]) and token_ok
+            
+            # Sisanya dibagi ke dua "worker" yang memegang state masing-masing
+            for n, index in enumerate(order[3:]):
+                worker = resumed if n % 2 else upload
+                worker.write_chunk(index, test_data[index * size:(index + 1) * size], cipher)
+            resumed_ok = resumed_ok and upload.received() == resumed.received() == sorted(order)
+            path = resumed.complete()
+            resumed_ok = resumed_ok and upload.status()['complete']
+            
+            expected = io.BytesIO()
+            key_check = (bytes.fromhex(resumed.state['salt']), bytes.fromhex(resumed.state['fingerprint']))
+            with ContainerWriter(expected, cipher_type, key, cipher, chunk_size, key_check) as writer:
+                writer.write(test_data)
+            with open(path, 'rb') as f:
+                same_bytes = f.read() == expected.getvalue()
+            with ContainerReader(path, cipher) as reader:
+                decrypted = reader.read_all()
+        
+        match = resumed_ok and same_bytes and decrypted == cipher.decrypt_bytes(cipher.encrypt_bytes(test_data))
+        print(f"{cipher_type}: resumed={resumed_ok}, same as writer={same_bytes}, match={match}")
+        success = success and match
+    
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_dictionary_attack():
+    print("=== Testing Dictionary Attack ===")
+    plaintext = ("It was the best of times, it was the worst of times, it was the age of wisdom, "
+                 "it was the age of foolishness, it was the epoch of belief, it was the epoch of "
+                 "incredulity, it was the season of light, it was the season of darkness.")
+    # Kata acak sebagai pengecoh, ditambah variasi kapitalisasi dan tanda baca
+    words = [''.join(chr(65 + (i * 7 + j * 13) % 26) for j in range(3 + i % 8)) for i in range(5000)]
+    words[1234] = "lighthouse"
+    words[4321] = "Zebra's"
+    wordlist = Wordlist.from_words(words)
+    
+    success = wordlist.word(1234) == "LIGHTHOUSE" and keyword_alphabet("ZEBRAS") == "ZEBRASCDFGHIJKLMNOPQTUVWXY"
+    for cipher_type, cipher in [("vigenere", VigenereCipher("LIGHTHOUSE")),
+                                ("substitution", SubstitutionCipher(keyword_alphabet("ZEBRAS")))]:
+        ciphertext = cipher.encrypt(plaintext)
+        report = dictionary_attack(ciphertext, cipher_type, wordlist, top=3, workers=1, batch_size=512)
+        best = report['results'][0]
+        match = (best['key'] == cipher.key and best['preview'] == plaintext[:60].upper()
+                 and report['candidates'] == len(words))
+        print(f"{cipher_type}: top={best['keyword']}, {report['candidates_per_second']} kandidat/detik, match={match}")
+        success = success and match
+    
+    print(f"Success: {success}")
+    print()
+    assert success
+
+def test_key_generation():
+    print("=== Testing Key Generation ===")
+    plaintext = "HELLOWORLDXYZABCDEFGHIJKLMNOPQ"
+    
+    success = True
+    for cipher_type in ["shift", "substitution", "affine", "vigenere", "hill", "permutation"]:
+        keys = generate_keys(cipher_type, 500)
+        # Semua kunci harus valid: enkripsi lalu dekripsi kembali ke plaintext
+        valid = all(create_cipher(cipher_type, key).decrypt(create_cipher(cipher_type, key).encrypt(plaintext)) == plaintext
+                    for key in keys)
+        print(f"{cipher_type}: {len(keys)} kunci, contoh {keys[0]}, valid={valid}")
+        success = success and len(keys) == 500 and valid
+    
+    # Kunci Hill juga harus bisa dipakai untuk file (determinan ganjil)
+    hill_bytes = all(HillCipher(key).decrypt_bytes(HillCipher(key).encrypt_bytes(b"data\x00\xff")) == b"data\x00\xff"
+                     for key in generate_keys("hill", 100, size=4))
+    try:
+        HillCipher("ABCDEFGHIJKLMNOP")
+        rejects_singular = False
+    except ValueError:
+        rejects_singular = True
+    
+    # Vigenere 1 huruf: 'A' (identitas) tidak boleh muncul
+    no_identity = "A" not in generate_keys("vigenere", 2000, size=1)
+    letters_ok = key_letters("hill", 10, 3) == 90 and key_letters("vigenere", 1000, 100000) == 10 ** 8
+    
+    permutations = random_permutations(24000, 4)
+    distinct = len(set(map(tuple, permutations.tolist())))
+    
+    pool = KeyPool(pool_size=32, refill_below=8)
+    first = pool.take("vigenere", 3)
+    pooled = pool.take("hill", 2, size=2)
+    pool_ok = len(first) == 3 and len(pooled) == 2 and all(len(key) == 4 for key in pooled)
+    
+    print(f"hill bytes={hill_bytes}, singular ditolak={rejects_singular}, tanpa identitas={no_identity}, "
+          f"permutasi unik={distinct}, pool={pool_ok}")
+    success = success and hill_bytes and rejects_singular and no_identity and letters_ok and distinct == 24 and pool_ok
+    print(f"Success: {success}")
+    print()
+    assert success
+
 if __name__ == "__main__":
     print("Testing All Ciphers")
     print("=" * 50)
@@ -117,5 +593,19 @@ if __name__ == "__main__":
     test_hill_cipher()
     test_permutation_cipher()
     test_file_encryption()
+    test_container_format()
+    test_stream_encryption()
+    test_engine_dispatch()
+    test_hill_binary()
+    test_bulk_encryption()
+    test_result_cache()
+    test_incremental_encryption()
+    test_cold_start_import()
+    test_registry_entry_points()
+    test_memory_admission()
+    test_frequency_analysis()
+    test_chunked_upload()
+    test_dictionary_attack()
+    test_key_generation()
     
     print("All tests completed!")
@@ -0,0 +1,338 @@
+"""
+Upload file per chunk yang bisa dilanjutkan (resumable)
+
+Browser memotong file menjadi chunk bernomor dan mengirimnya secara paralel.
+Setiap chunk langsung dienkripsi saat tiba dan ditulis ke posisi akhirnya di
+file kontainer, sehingga urutan kedatangan tidak penting dan hasil akhir
+tidak perlu dibaca ulang. Mode byte semua cipher tidak bergantung pada posisi
+di tingkat chunk (ukuran chunk kelipatan ukuran blok, fase kunci selalu 0),
+jadi setiap chunk bisa diproses sendiri-sendiri.
+
+Metadata upload ditulis sekali sebagai file JSON di samping file output.
+Setiap chunk yang sudah aman di disk dicatat sebagai satu baris di log
+append-only, dan daftar chunk yang diterima selalu dibangun ulang dari log
+tersebut. Dengan begitu beberapa worker server bisa menerima chunk dari upload
+yang sama tanpa saling menimpa, biaya I/O per chunk tetap konstan, dan upload
+yang terputus (atau server yang restart) bisa dilanjutkan dari chunk terakhir
+yang sudah dikonfirmasi. Kunci cipher tidak pernah disimpan, hanya fingerprint
+dan salt-nya (seperti di header kontainer).
+
+Kunci diverifikasi dengan PBKDF2 hanya saat upload dibuat atau dilanjutkan.
+Keduanya mengembalikan token per upload (HMAC dari hasil PBKDF2 dan id upload),
+dan request chunk/status cukup mencocokkan token itu plus MAC kunci yang murah.
+Di disk hanya tersimpan hash token dan MAC kunci dengan token sebagai kunci
+HMAC, jadi state tidak bisa dipakai untuk menebak kunci tanpa PBKDF2.
+"""
+
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import threading
+import time
+
+from container import (
+    ChunkEntry, DEFAULT_CHUNK_SIZE, HEADER_STRUCT, aligned_chunk_size, payload_size,
+    pack_header, pack_index, SALT_SIZE, key_digest, key_material, encrypt_chunk
+)
+
+MAX_CHUNK_SIZE = 8 * 1024 * 1024
+
+
+class UploadError(ValueError):
+    """Error untuk upload yang tidak valid atau tidak cocok"""
+
+
+def _upload_token(digest: bytes, upload_id: str) -> str:
+    """Token upload dari hasil PBKDF2 kunci, sama untuk kunci yang sama"""
+    return hmac.new(digest, upload_id.encode('ascii'), hashlib.sha256).hexdigest()
+
+
+def _key_mac(token: str, cipher_type: str, key: str) -> str:
+    return hmac.new(token.encode('ascii'), key_material(cipher_type, key), hashlib.sha256).hexdigest()
+
+
+class ChunkedUpload:
+    """Satu upload: file kontainer yang diisi per chunk, metadata JSON dan log chunk"""
+
+    def __init__(self, directory: str, upload_id: str, state: dict):
+        self.directory = directory
+        self.upload_id = upload_id
+        self.state = state
+        # Token hanya diketahui setelah create atau resume, tidak pernah disimpan
+        self.token = None
+        self._lock = threading.Lock()
+
+    @property
+    def state_path(self) -> str:
+        return os.path.join(self.directory, self.upload_id + '.json')
+
+    @property
+    def output_path(self) -> str:
+        return os.path.join(self.directory, self.upload_id + '.dat')
+
+    @property
+    def log_path(self) -> str:
+        return os.path.join(self.directory, self.upload_id + '.log')
+
+    @property
+    def done_path(self) -> str:
+        return os.path.join(self.directory, self.upload_id + '.done')
+
+    @classmethod
+    def create(cls, directory: str, file_name: str, size: int, cipher_type: str, key: str,
+               cipher, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """Siapkan upload baru dan alokasikan file output"""
+        if size < 0:
+            raise UploadError('Ukuran file tidak valid')
+        chunk_size = aligned_chunk_size(cipher, min(max(chunk_size, 1), MAX_CHUNK_SIZE))
+        chunk_count = -(-size // chunk_size)
+
+        # Offset setiap chunk sudah pasti sejak awal karena panjang payload
+        # hanya bergantung pada panjang plaintext
+        data_offset = HEADER_STRUCT.size + len(cipher_type.encode('ascii'))
+        full_payload = payload_size(cipher, chunk_size)
+        index_offset = data_offset
+        if chunk_count:
+            last_plain = size - (chunk_count - 1) * chunk_size
+            index_offset += (chunk_count - 1) * full_payload + payload_size(cipher, last_plain)
+
+        upload_id = secrets.token_urlsafe(16)
+        salt = os.urandom(SALT_SIZE)
+        digest = key_digest(cipher_type, key, salt)
+        token = _upload_token(digest, upload_id)
+        upload = cls(directory, upload_id, {
+            'file_name': file_name,
+            'size': size,
+            'cipher_type': cipher_type,
+            'fingerprint': digest[:8].hex(),
+            'salt': salt.hex(),
+            'token_hash': hashlib.sha256(token.encode('ascii')).hexdigest(),
+            'key_mac': _key_mac(token, cipher_type, key),
+            'chunk_size': chunk_size,
+            'chunk_count': chunk_count,
+            'data_offset': data_offset,
+            'payload_size': full_payload,
+            'index_offset': index_offset,
+            'created': time.time(),
+        })
+        with open(upload.output_path, 'wb') as f:
+            f.truncate(index_offset)
+        upload._save()
+        upload.token = token
+        return upload
+
+    @classmethod
+    def load(cls, directory: str, upload_id: str):
+        """Muat upload dari state di disk, None jika tidak ada"""
+        # upload_id berasal dari URL, pastikan tidak keluar dari direktori upload
+        if not upload_id or os.path.basename(upload_id) != upload_id or upload_id.startswith('.'):
+            return None
+        try:
+            with open(os.path.join(directory, upload_id + '.json'), 'r', encoding='utf-8') as f:
+                return cls(directory, upload_id, json.load(f))
+        except (OSError, ValueError):
+            return None
+
+    def _save(self):
+        """Tulis metadata ke file sementara lalu rename agar tidak pernah setengah jadi"""
+        temp_path = f'{self.state_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.state, f)
+        os.replace(temp_path, self.state_path)
+
+    def resume(self, cipher_type: str, key: str):
+        """
+        Verifikasi kunci dengan PBKDF2 (mahal, sekali per sesi upload) dan
+        kembalikan token upload, None jika tipe cipher atau kunci tidak cocok
+        """
+        if cipher_type != self.state['cipher_type']:
+            return None
+        digest = key_digest(cipher_type, key, bytes.fromhex(self.state['salt']))
+        if not hmac.compare_digest(digest[:8].hex(), self.state['fingerprint']):
+            return None
+        self.token = _upload_token(digest, self.upload_id)
+        return self.token
+
+    def check_token(self, token: str, cipher_type: str, key: str) -> bool:
+        """Cek token upload dan kunci chunk tanpa PBKDF2"""
+        if not token or cipher_type != self.state['cipher_type']:
+            return False
+        token_hash = hashlib.sha256(token.encode('utf-8')).hexdigest()
+        if not hmac.compare_digest(token_hash, self.state['token_hash']):
+            return False
+        # Kunci tetap dicek agar chunk tidak terenkripsi dengan kunci lain
+        return hmac.compare_digest(_key_mac(token, cipher_type, key), self.state['key_mac'])
+
+    def plain_length(self, index: int) -> int:
+        """Panjang plaintext chunk ke-index"""
+        if not 0 <= index < self.state['chunk_count']:
+            raise UploadError(f'Nomor chunk di luar batas: {index}')
+        start = index * self.state['chunk_size']
+        return min(self.state['chunk_size'], self.state['size'] - start)
+
+    def write_chunk(self, index: int, data: bytes, cipher):
+        """Enkripsi satu chunk dan tulis langsung ke posisinya di file output"""
+        if self.is_complete():
+            raise UploadError('Upload sudah selesai')
+        expected = self.plain_length(index)
+        if len(data) != expected:
+            raise UploadError(f'Panjang chunk {index} harus {expected} byte, diterima {len(data)}')
+
+        payload, checksum = encrypt_chunk(cipher, data)
+        if len(payload) != payload_size(cipher, expected):
+            raise UploadError('Panjang payload tidak sesuai dengan tata letak file')
+
+        offset = self.state['data_offset'] + index * self.state['payload_size']
+        with open(self.output_path, 'r+b') as f:
+            f.seek(offset)
+            f.write(payload)
+            f.flush()
+            # Chunk baru dikonfirmasi setelah datanya aman di disk
+            os.fsync(f.fileno())
+
+        # Satu write() kecil dengan O_APPEND: baris dari process lain tidak
+        # tertimpa dan file lama tidak perlu ditulis ulang
+        record = (json.dumps([index, offset, len(payload), expected, checksum]) + '\n').encode('ascii')
+        fd = os.open(self.log_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, record)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def _chunks(self) -> dict:
+        """Chunk yang sudah dikonfirmasi menurut log: {index: [offset, panjang, plain, checksum]}"""
+        chunks = {}
+        try:
+            with open(self.log_path, 'r', encoding='ascii') as f:
+                for line in f:
+                    try:
+                        index, *entry = json.loads(line)
+                    except ValueError:
+                        # Baris terakhir bisa terpotong jika process mati saat menulis
+                        continue
+                    chunks[index] = entry
+        except FileNotFoundError:
+            pass
+        return chunks
+
+    def received(self) -> list:
+        """Nomor chunk yang sudah diterima, terurut"""
+        return sorted(self._chunks())
+
+    def is_complete(self) -> bool:
+        return os.path.exists(self.done_path)
+
+    def complete(self) -> str:
+        """Tulis index dan header, mengembalikan path file kontainer"""
+        with self._lock:
+            if self.is_complete():
+                return self.output_path
+
+            chunks = self._chunks()
+            missing = [i for i in range(self.state['chunk_count']) if i not in chunks]
+            if missing:
+                raise UploadError(f'{len(missing)} chunk belum diterima')
+
+            entries = [ChunkEntry(*chunks[i][:3], 0, chunks[i][3])
+                       for i in range(self.state['chunk_count'])]
+            header = pack_header(
+                self.state['cipher_type'], self.state['size'], self.state['chunk_size'],
+                len(entries), self.state['index_offset'], bytes.fromhex(self.state['fingerprint']),
+                bytes.fromhex(self.state['salt'])
+            )
+
+            with open(self.output_path, 'r+b') as f:
+                f.seek(self.state['index_offset'])
+                f.write(pack_index(entries))
+                f.truncate()
+                f.seek(0)
+                f.write(header)
+                f.flush()
+                os.fsync(f.fileno())
+
+            # Index dan header identik di setiap process, jadi complete yang
+            # berjalan bersamaan di worker lain tetap menghasilkan file yang sama
+            with open(self.done_path, 'w', encoding='ascii'):
+                pass
+            return self.output_path
+
+    def status(self) -> dict:
+        """Ringkasan progress untuk client"""
+        return {
+            'upload_id': self.upload_id,
+            'file_name': self.state['file_name'],
+            'size': self.state['size'],
+            'chunk_size': self.state['chunk_size'],
+            'chunk_count': self.state['chunk_count'],
+            'received': self.received(),
+            'complete': self.is_complete(),
+        }
+
+    def remove(self):
+        """Hapus metadata, log, penanda selesai dan file output"""
+        for path in (self.state_path, self.log_path, self.done_path, self.output_path):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+class UploadStore:
+    """
+    Kumpulan upload aktif. Metadata dibaca ulang dari disk setelah restart,
+    progress chunk selalu dari log sehingga aman dipakai banyak worker.
+    """
+
+    def __init__(self, directory: str, ttl: float = 24 * 60 * 60):
+        self.directory = directory
+        self.ttl = ttl
+        self._uploads = {}
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def create(self, file_name: str, size: int, cipher_type: str, key: str, cipher,
+               chunk_size: int = DEFAULT_CHUNK_SIZE) -> ChunkedUpload:
+        self._expire()
+        upload = ChunkedUpload.create(self.directory, file_name, size, cipher_type, key,
+                                      cipher, chunk_size)
+        with self._lock:
+            self._uploads[upload.upload_id] = upload
+        return upload
+
+    def get(self, upload_id: str):
+        """Ambil upload dari memori atau disk, None jika tidak ada"""
+        with self._lock:
+            upload = self._uploads.get(upload_id)
+            if upload is None:
+                upload = ChunkedUpload.load(self.directory, upload_id)
+                if upload is not None:
+                    self._uploads[upload_id] = upload
+            return upload
+
+    def remove(self, upload_id: str):
+        upload = self.get(upload_id)
+        if upload is not None:
+            with self._lock:
+                self._uploads.pop(upload_id, None)
+            upload.remove()
+
+    def _expire(self):
+        """Hapus upload yang tidak disentuh lebih lama dari ttl"""
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            upload_id = name[:-len('.json')]
+            # Metadata hanya ditulis sekali, aktivitas terakhir terlihat dari log chunk
+            touched = 0
+            for suffix in ('.json', '.log'):
+                try:
+                    touched = max(touched, os.path.getmtime(os.path.join(self.directory, upload_id + suffix)))
+                except OSError:
+                    pass
+            expired = touched and now - touched > self.ttl
+            if expired:
+                self.remove(upload_id)